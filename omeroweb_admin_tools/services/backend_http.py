@@ -0,0 +1,142 @@
+"""Keep-alive HTTP transport for Grafana/Prometheus backend requests."""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import ssl
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import urllib.error
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+BACKEND_POOL_MAX_IDLE_PER_HOST = 16
+
+# Built once: creating a default context loads the CA bundle from disk.
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Only these reuse idle keep-alive sockets, so only they can hit a stale one
+# and be resent: a forwarded body may already have reached the backend, and
+# it must not run twice. Other methods always open a fresh connection.
+_RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Errors raised when a reused keep-alive socket was closed by the backend.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """HTTP response that hands its connection back to the pool on close."""
+
+    release: Optional[Callable[[bool], None]] = None
+
+    def close(self) -> None:
+        # A body that was not fully consumed leaves bytes on the socket, so
+        # the connection can only be reused when the response is exhausted.
+        reusable = self.fp is None and not self.will_close
+        super().close()
+        release, self.release = self.release, None
+        if release is not None:
+            release(reusable)
+
+
+class _KeepAliveHTTPHandler(urllib.request.HTTPHandler, urllib.request.HTTPSHandler):
+    """urllib handler that reuses idle HTTP/1.1 connections per backend host."""
+
+    def __init__(self, max_idle_per_host: int = BACKEND_POOL_MAX_IDLE_PER_HOST):
+        urllib.request.HTTPHandler.__init__(self)
+        urllib.request.HTTPSHandler.__init__(self, context=_SSL_CONTEXT)
+        self._max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        # Reentrant: a response released from a finalizer may run on a thread
+        # that is already inside _checkout/_checkin.
+        self._lock = threading.RLock()
+
+    def http_open(self, req: urllib.request.Request):
+        return self._pooled_open(http.client.HTTPConnection, req)
+
+    def https_open(self, req: urllib.request.Request):
+        if req._tunnel_host:
+            # CONNECT tunnels through an outbound proxy are left to urllib.
+            return urllib.request.HTTPSHandler.https_open(self, req)
+        return self._pooled_open(http.client.HTTPSConnection, req)
+
+    def _pooled_open(self, connection_class, req: urllib.request.Request):
+        if not req.host:
+            raise urllib.error.URLError("no host given")
+        connection_kwargs = {}
+        if connection_class is http.client.HTTPSConnection:
+            connection_kwargs["context"] = _SSL_CONTEXT
+        key = (req.type, req.host)
+        headers = dict(req.unredirected_hdrs)
+        headers.update(
+            (name, value) for name, value in req.headers.items() if name not in headers
+        )
+        headers = {name.title(): value for name, value in headers.items()}
+
+        method = req.get_method()
+        connection = self._checkout(key) if method in _RETRYABLE_METHODS else None
+        reused = connection is not None
+        while True:
+            if connection is None:
+                connection = connection_class(
+                    req.host, timeout=req.timeout, **connection_kwargs
+                )
+            else:
+                connection.timeout = req.timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(req.timeout)
+            connection.response_class = _PooledHTTPResponse
+            try:
+                connection.request(method, req.selector, req.data, headers)
+                response = connection.getresponse()
+            except _STALE_CONNECTION_ERRORS as exc:
+                connection.close()
+                if not reused:
+                    raise urllib.error.URLError(exc)
+                logger.debug("Retrying %s on a fresh connection", req.full_url)
+                connection, reused = None, False
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                raise urllib.error.URLError(exc)
+            break
+
+        response.release = lambda reusable: self._checkin(key, connection, reusable)
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        return response
+
+    def _checkout(self, key: Tuple[str, str]) -> Optional[http.client.HTTPConnection]:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def _checkin(
+        self,
+        key: Tuple[str, str],
+        connection: http.client.HTTPConnection,
+        reusable: bool,
+    ) -> None:
+        if reusable and connection.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle_per_host:
+                    idle.append(connection)
+                    return
+        connection.close()
+
+
+_BACKEND_OPENER = urllib.request.build_opener(_KeepAliveHTTPHandler())
+
+
+def open_backend_url(url: Union[str, urllib.request.Request], timeout: float):
+    """Open ``url`` like ``urllib.request.urlopen`` over pooled connections."""
+    return _BACKEND_OPENER.open(url, timeout=timeout)
+
@@ -7,12 +7,15 @@ import logging
 import os
 import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pwd import getpwuid
 from grp import getgrgid
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import portalocker
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,7 @@ STATE_SCHEMA_VERSION_KEY = "state_schema_version"
 AUTO_GROUP_QUOTA_ENV = "ADMIN_TOOLS_AUTO_SET_DEFAULT_GROUP_QUOTA"
 DEFAULT_GROUP_QUOTA_ENV = "ADMIN_TOOLS_DEFAULT_GROUP_QUOTA_GB"
 MIN_GROUP_QUOTA_ENV = "ADMIN_TOOLS_MIN_QUOTA_GB"
+STATE_LOCK_TIMEOUT_SECONDS = 10.0
 _RECONCILE_LOCK = threading.Lock()
 
 
@@ -180,7 +184,7 @@ def resolve_managed_group_root(known_groups: Sequence[str]) -> Tuple[Path, str]:
     """Return configured managed repository root without fallback resolution."""
     del known_groups
     group_root = managed_group_root()
-    if group_root.exists() and group_root.is_dir():
+    if group_root.is_dir():
         return group_root, "using configured managed repository root"
     return group_root, "configured managed repository root does not exist"
 
@@ -191,7 +195,7 @@ def _is_safe_managed_repository_root(path: Path) -> Tuple[bool, str]:
     except FileNotFoundError:
         resolved = path
 
-    if not path.exists() or not path.is_dir():
+    if not path.is_dir():
         return False, "path does not exist or is not a directory"
 
     omero_data_root = Path(
@@ -212,6 +216,38 @@ def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+@contextmanager
+def _locked_state(path: Path) -> Iterator[None]:
+    """Hold an exclusive cross-process lock around a state read-modify-write.
+
+    The lock lives in a sibling ``.lock`` file so the state file itself can
+    still be atomically replaced while the lock is held.  When the lock file
+    cannot be created (read-only state directory) the caller proceeds
+    unlocked; any subsequent write fails the same way it did before.
+    """
+    lock_path = path.with_suffix(f"{path.suffix}.lock")
+    lock = portalocker.Lock(lock_path, mode="a", timeout=STATE_LOCK_TIMEOUT_SECONDS)
+    try:
+        _ensure_parent(path)
+        lock.acquire()
+    except portalocker.exceptions.LockException as exc:
+        raise QuotaError(
+            f"Timed out waiting for quota state lock: {lock_path}"
+        ) from exc
+    except OSError:
+        logger.warning(
+            "Could not create quota state lock %s; continuing without lock",
+            lock_path,
+            exc_info=True,
+        )
+        lock = None
+    try:
+        yield
+    finally:
+        if lock is not None:
+            lock.release()
+
+
 def _fresh_state() -> Dict[str, object]:
     """Return a blank quota state dict."""
     return {
@@ -224,24 +260,27 @@ def _fresh_state() -> Dict[str, object]:
 def _load_state(path: Path) -> Dict[str, object]:
     if not path.exists():
         return _fresh_state()
-    raw = path.read_text(encoding="utf-8")
-    if not raw.strip():
+    raw = path.read_bytes()
+    stripped = raw.lstrip()
+    if not stripped:
         logger.warning(
             "Quota state file %s is empty; initialising fresh state", path
         )
         return _fresh_state()
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
+    # Only a JSON object can be valid state; reject anything else without
+    # running the full parser over it.
+    if not stripped.startswith(b"{"):
         logger.warning(
-            "Quota state file %s contains invalid JSON; initialising fresh state",
+            "Quota state file %s does not contain a JSON object; "
+            "initialising fresh state",
             path,
         )
         return _fresh_state()
-    if not isinstance(data, dict):
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         logger.warning(
-            "Quota state file %s does not contain a JSON object; "
-            "initialising fresh state",
+            "Quota state file %s contains invalid JSON; initialising fresh state",
             path,
         )
         return _fresh_state()
@@ -258,6 +297,39 @@ def _load_state(path: Path) -> Dict[str, object]:
     return data
 
 
+def _write_synced(path: Path, data: bytes) -> None:
+    """Create ``path`` with ``data`` durably on disk.
+
+    With ``O_DSYNC`` each write returns only once the data is stable, so no
+    separate ``fsync`` is needed; platforms without it fall back to one.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_DSYNC", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if not hasattr(os, "O_DSYNC"):
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist a rename in ``path``; best effort where directories can't be opened."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def _write_state(path: Path, state: Dict[str, object]) -> None:
     state[STATE_SCHEMA_VERSION_KEY] = STATE_SCHEMA_VERSION
     _ensure_parent(path)
@@ -270,13 +342,14 @@ def _write_state(path: Path, state: Dict[str, object]) -> None:
     temp_path = path.with_suffix(f"{path.suffix}.tmp_{random_suffix}")
     
     try:
-        temp_path.write_text(serialized, encoding="utf-8")
+        _write_synced(temp_path, serialized.encode("utf-8"))
         
         # Ensure the final file maintains readability for the host enforcer (root)
         os.chmod(temp_path, 0o666)
         
         # os.replace is atomic on POSIX
         os.replace(temp_path, path)
+        _fsync_directory(path.parent)
     except PermissionError as exc:
         # Fallback if replacing fails (e.g., sticky bit preventing rename)
         if temp_path.exists():
@@ -321,25 +394,27 @@ def _append_log(state: Dict[str, object], level: str, message: str) -> None:
 
 
 def _reconcile_event_cache(state: Dict[str, object]) -> Dict[str, str]:
-    cache = state.setdefault("_reconcile_event_cache", {})
+    """Return the normalized event cache, attached to ``state``.
+
+    Call once per reconciliation and thread the returned dict through
+    ``_append_reconcile_event`` so events only touch their own key.
+    """
+    cache = state.get("_reconcile_event_cache")
     if not isinstance(cache, dict):
         cache = {}
-        state["_reconcile_event_cache"] = cache
-    normalized: Dict[str, str] = {}
-    for key, value in cache.items():
-        normalized[str(key)] = str(value)
+    normalized = {str(key): str(value) for key, value in cache.items()}
     state["_reconcile_event_cache"] = normalized
     return normalized
 
 
 def _append_reconcile_event(
     state: Dict[str, object],
+    cache: Dict[str, str],
     *,
     event_key: str,
     level: str,
     message: str,
 ) -> None:
-    cache = _reconcile_event_cache(state)
     cache_value = f"{level}|{message}"
     if level != "warning" and cache.get(event_key) == cache_value:
         return
@@ -348,12 +423,9 @@ def _append_reconcile_event(
 
 
 def _prune_reconcile_event_cache(
-    state: Dict[str, object], valid_keys: Sequence[str]
+    cache: Dict[str, str], valid_keys: Sequence[str]
 ) -> None:
-    cache = _reconcile_event_cache(state)
-    valid = {str(key) for key in valid_keys}
-    stale_keys = [key for key in cache if key not in valid]
-    for key in stale_keys:
+    for key in cache.keys() - set(valid_keys):
         del cache[key]
 
 
@@ -425,65 +497,67 @@ def detect_filesystem(path: Path) -> FilesystemInfo:
     )
 
 
-def _is_group_folder_available(group_path: Path) -> bool:
-    return group_path.exists() and group_path.is_dir()
-
-
 def _can_manage_group_directories(group_root: Path) -> bool:
     return os.access(group_root, os.W_OK | os.X_OK)
 
 
 def upsert_quotas(
-    updates: Sequence[Tuple[str, object]], source: str = "ui"
+    updates: Iterable[Tuple[str, object]], source: str = "ui"
 ) -> Dict[str, object]:
-    """Update quotas in GB and return the latest full state."""
-    path = quota_state_path()
-    state = _load_state(path)
-    quotas = state.setdefault("quotas_gb", {})
-    assert isinstance(quotas, dict)
-    changed = False
+    """Update quotas in GB and return the latest full state.
 
+    All updates are validated first and applied under one lock with a single
+    state write. When a group appears more than once the last value wins.
+    """
+    normalized: Dict[str, Optional[float]] = {}
     for raw_group, raw_quota in updates:
-        group_name = _normalize_group(raw_group)
-        quota_gb = _normalize_quota_gb(raw_quota)
-        if quota_gb is None:
-            if group_name in quotas:
-                del quotas[group_name]
-                changed = True
-                _append_log(
-                    state,
-                    "info",
-                    f"Deleted quota for group '{group_name}' (source={source}).",
-                )
-            continue
+        normalized[_normalize_group(raw_group)] = _normalize_quota_gb(raw_quota)
 
-        existing_quota = quotas.get(group_name)
-        if existing_quota == quota_gb:
-            continue
+    path = quota_state_path()
+    with _locked_state(path):
+        state = _load_state(path)
+        quotas = state.setdefault("quotas_gb", {})
+        assert isinstance(quotas, dict)
+        changed = False
+        source_tag = f"(source={source})"
+
+        for group_name, quota_gb in normalized.items():
+            if quota_gb is None:
+                if group_name in quotas:
+                    del quotas[group_name]
+                    changed = True
+                    _append_log(
+                        state,
+                        "info",
+                        f"Deleted quota for group '{group_name}' {source_tag}.",
+                    )
+                continue
 
-        quotas[group_name] = quota_gb
-        changed = True
-        _append_log(
-            state,
-            "info",
-            f"Updated quota for group '{group_name}' to {quota_gb:.3f} GB (source={source}).",
-        )
+            existing_quota = quotas.get(group_name)
+            if existing_quota == quota_gb:
+                continue
 
-    if changed:
-        _write_state(path, state)
-    return state
+            quotas[group_name] = quota_gb
+            changed = True
+            _append_log(
+                state,
+                "info",
+                f"Updated quota for group '{group_name}' to {quota_gb:.3f} GB {source_tag}.",
+            )
+
+        if changed:
+            _write_state(path, state)
+        return state
 
 
 def import_quotas_csv(content: str) -> Dict[str, object]:
     """Import quotas from CSV content containing Group,Quota [GB]."""
     reader = csv.reader(io.StringIO(content))
-    rows = list(reader)
-    if not rows:
+    if next(reader, None) is None:
         raise QuotaError("CSV file is empty")
 
-    data_rows = rows[1:] if rows else []
     updates: List[Tuple[str, object]] = []
-    for index, row in enumerate(data_rows, start=2):
+    for index, row in enumerate(reader, start=2):
         if not row or all(not str(cell).strip() for cell in row):
             continue
         if len(row) < 2:
@@ -502,9 +576,11 @@ def quota_csv_template() -> str:
 
 def list_group_directories(group_root: Path) -> List[str]:
     """List group directory names from managed repository root."""
-    if not group_root.exists() or not group_root.is_dir():
+    try:
+        with os.scandir(group_root) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    names = [entry.name for entry in group_root.iterdir() if entry.is_dir()]
     return sorted(names)
 
 
@@ -536,8 +612,8 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
     performed by the host-side systemd timer (omero-quota-enforcer) which
     reads the same state file with root privileges.
     """
-    with _RECONCILE_LOCK:
-        path = quota_state_path()
+    path = quota_state_path()
+    with _RECONCILE_LOCK, _locked_state(path):
         state = _load_state(path)
         quotas = state.setdefault("quotas_gb", {})
         assert isinstance(quotas, dict)
@@ -566,10 +642,11 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
 
         group_root, root_reason = resolve_managed_group_root(known_groups)
         root_is_safe, root_safety_reason = _is_safe_managed_repository_root(group_root)
-        available_groups = (
+        # One directory scan answers every per-group existence check below.
+        existing_group_dirs = (
             set(list_group_directories(group_root)) if root_is_safe else set()
         )
-        available_groups.update(set(known_groups))
+        available_groups = existing_group_dirs | set(known_groups)
 
         filesystem = detect_filesystem(group_root)
         repository_compatibility = managed_repository_compatibility()
@@ -579,6 +656,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
 
         configured = []
         pending = []
+        event_cache = _reconcile_event_cache(state)
         reconcile_event_keys: List[str] = []
 
         if not root_is_safe:
@@ -586,6 +664,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
             reconcile_event_keys.append(event_key)
             _append_reconcile_event(
                 state,
+                event_cache,
                 event_key=event_key,
                 level="error",
                 message=(
@@ -599,6 +678,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
             reconcile_event_keys.append(event_key)
             _append_reconcile_event(
                 state,
+                event_cache,
                 event_key=event_key,
                 level="error",
                 message=(
@@ -615,6 +695,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
             except QuotaError as exc:
                 _append_reconcile_event(
                     state,
+                    event_cache,
                     event_key=group_key,
                     level="error",
                     message=f"Invalid stored quota for group '{group_name}': {exc}",
@@ -628,11 +709,12 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
             if not repository_compatibility["is_compatible"]:
                 pending.append(group_name)
                 continue
-            if not _is_group_folder_available(group_path):
+            if group_name not in existing_group_dirs:
                 pending.append(group_name)
                 if not _can_manage_group_directories(group_root):
                     _append_reconcile_event(
                         state,
+                        event_cache,
                         event_key=group_key,
                         level="info",
                         message=(
@@ -649,6 +731,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
                 else:
                     _append_reconcile_event(
                         state,
+                        event_cache,
                         event_key=group_key,
                         level="info",
                         message=(
@@ -662,6 +745,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
             configured.append(group_name)
             _append_reconcile_event(
                 state,
+                event_cache,
                 event_key=group_key,
                 level="info",
                 message=(
@@ -670,7 +754,7 @@ def reconcile_quotas(known_groups: Sequence[str]) -> Dict[str, object]:
                 ),
             )
 
-        _prune_reconcile_event_cache(state, reconcile_event_keys)
+        _prune_reconcile_event_cache(event_cache, reconcile_event_keys)
         try:
             _write_state(path, state)
         except OSError:
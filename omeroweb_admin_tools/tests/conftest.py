@@ -0,0 +1,59 @@
+"""Shared fixtures for admin tools tests."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from omeroweb_admin_tools.services.storage_quotas import (
+    AUTO_GROUP_QUOTA_ENV,
+    DEFAULT_GROUP_QUOTA_ENV,
+    MIN_GROUP_QUOTA_ENV,
+)
+from omeroweb_admin_tools.services.system_diagnostics import run_diagnostic_script
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _set_required_quota_env():
+    """Set the required quota environment once for the whole session.
+
+    Tests that need other values override them with the function-scoped
+    ``monkeypatch`` fixture, which restores these defaults afterwards.
+    """
+    session_monkeypatch = pytest.MonkeyPatch()
+    session_monkeypatch.setenv(MIN_GROUP_QUOTA_ENV, "0.10")
+    session_monkeypatch.setenv(DEFAULT_GROUP_QUOTA_ENV, "0.10")
+    session_monkeypatch.setenv(AUTO_GROUP_QUOTA_ENV, "false")
+    try:
+        yield
+    finally:
+        session_monkeypatch.undo()
+
+
+@pytest.fixture(autouse=True)
+def _clear_django_cache():
+    """Keep cached view payloads from leaking between tests."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def prebuilt_safe_root(tmp_path_factory):
+    """Return a managed group root with ``group-a``, ``group-b`` and ``existing-group``.
+
+    The tree is built once per session; only use it from tests that treat the
+    layout as read-only and keep their state file under ``tmp_path``.
+    """
+    safe_root = tmp_path_factory.mktemp("safe_roots") / "group-root"
+    for group_name in ("group-a", "group-b", "existing-group"):
+        os.makedirs(safe_root / group_name)
+    return safe_root
+
+
+@pytest.fixture(scope="session")
+def e2e_diagnostic_payload():
+    """Return the ``platform_end_to_end`` diagnostic payload, run once per session."""
+    return run_diagnostic_script("platform_end_to_end")
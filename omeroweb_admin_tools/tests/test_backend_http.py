@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from omeroweb_admin_tools.services.backend_http import open_backend_url
+
+
+@pytest.fixture
+def backend_server():
+    client_ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.append(self.client_address[1])
+            if self.path == "/garbage":
+                self.wfile.write(b"NOT HTTP\r\n\r\n")
+                self.close_connection = True
+                return
+            status = 404 if self.path == "/missing" else 200
+            body = self.path.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            # Drop the socket without announcing it, like an idle timeout.
+            if self.path.startswith("/drop"):
+                self.close_connection = True
+
+        def do_POST(self):
+            client_ports.append(self.client_address[1])
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", client_ports
+    server.shutdown()
+    server.server_close()
+
+
+def test_open_backend_url_reuses_keep_alive_connection(backend_server) -> None:
+    base_url, client_ports = backend_server
+
+    for index in range(3):
+        with open_backend_url(f"{base_url}/query/{index}", timeout=2.0) as response:
+            assert response.status == 200
+            assert response.read() == f"/query/{index}".encode("utf-8")
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        open_backend_url(f"{base_url}/missing", timeout=2.0)
+    assert excinfo.value.code == 404
+    assert excinfo.value.read() == b"/missing"
+    excinfo.value.close()
+
+    assert len(client_ports) == 4
+    assert len(set(client_ports)) == 1
+
+
+def test_open_backend_url_retries_stale_socket_for_idempotent_methods(
+    backend_server,
+) -> None:
+    base_url, client_ports = backend_server
+
+    with open_backend_url(f"{base_url}/drop/1", timeout=2.0) as response:
+        response.read()
+    with open_backend_url(f"{base_url}/query", timeout=2.0) as response:
+        assert response.read() == b"/query"
+    assert len(client_ports) == 2
+    assert client_ports[0] != client_ports[1]
+
+
+def test_open_backend_url_sends_post_on_fresh_connection(backend_server) -> None:
+    base_url, client_ports = backend_server
+
+    with open_backend_url(f"{base_url}/drop/1", timeout=2.0) as response:
+        response.read()
+    request = urllib.request.Request(
+        f"{base_url}/write", data=b"payload", method="POST"
+    )
+    with open_backend_url(request, timeout=2.0) as response:
+        assert response.status == 200
+    assert len(client_ports) == 2
+    assert client_ports[0] != client_ports[1]
+
+
+def test_open_backend_url_wraps_malformed_responses(backend_server) -> None:
+    base_url, _ = backend_server
+
+    with pytest.raises(urllib.error.URLError) as excinfo:
+        open_backend_url(f"{base_url}/garbage", timeout=2.0)
+    assert "NOT HTTP" in str(excinfo.value.reason)
+
+
+def test_probe_http_url_releases_error_responses_for_reuse(backend_server) -> None:
+    from omeroweb_admin_tools.views.index_view import _probe_http_url
+
+    base_url, client_ports = backend_server
+
+    for _ in range(2):
+        assert _probe_http_url(f"{base_url}/missing") == {
+            "ok": False,
+            "status": 404,
+            "error": "HTTP 404",
+        }
+    assert _probe_http_url(f"{base_url}/ready")["ok"] is True
+
+    assert len(client_ports) == 3
+    assert len(set(client_ports)) == 1
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import json
+from types import SimpleNamespace
+
 import pytest
+from django.test import RequestFactory
 
 from omeroweb_admin_tools.services.log_query import (
     LogEntry,
@@ -94,3 +98,61 @@ def test_cap_entries_per_container_does_not_apply_global_cap() -> None:
     capped = _cap_entries_per_container(entries, 2)
     assert len(capped) == 3
 
+
+
+def test_logs_data_filters_level_and_query_together(monkeypatch) -> None:
+    from omeroweb_admin_tools.views.index_view import logs_data
+
+    entries = [
+        LogEntry("2024-01-01T00:00:00Z", "omeroweb", "error", "Disk FULL"),
+        LogEntry("2024-01-01T00:00:01Z", "omeroweb", "info", "disk ok"),
+        LogEntry("2024-01-01T00:00:02Z", "database", "error", "connection lost"),
+    ]
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.optional_log_config",
+        lambda: SimpleNamespace(lookback_seconds=3600, max_entries=100),
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.fetch_loki_logs",
+        lambda *args, **kwargs: list(entries),
+    )
+    request = RequestFactory().get(
+        "/logs/data", {"container": "omeroweb", "level": "error", "query": "disk"}
+    )
+    conn = SimpleNamespace(getUser=lambda: SimpleNamespace(getName=lambda: "root"))
+
+    response = logs_data(request, conn=conn)
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["entries"] == [
+        {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "container": "omeroweb",
+            "level": "error",
+            "message": "Disk FULL",
+        }
+    ]
+
+
+def test_logs_data_matches_uncased_query_without_lowercasing(monkeypatch) -> None:
+    from omeroweb_admin_tools.views.index_view import logs_data
+
+    entries = [
+        LogEntry("2024-01-01T00:00:00Z", "omeroweb", "error", "GET /api 503"),
+        LogEntry("2024-01-01T00:00:01Z", "omeroweb", "info", "GET /api 200"),
+    ]
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.optional_log_config",
+        lambda: SimpleNamespace(lookback_seconds=3600, max_entries=100),
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.fetch_loki_logs",
+        lambda *args, **kwargs: list(entries),
+    )
+    request = RequestFactory().get("/logs/data", {"container": "omeroweb", "query": "503"})
+    conn = SimpleNamespace(getUser=lambda: SimpleNamespace(getName=lambda: "root"))
+
+    response = logs_data(request, conn=conn)
+
+    messages = [entry["message"] for entry in json.loads(response.content)["entries"]]
+    assert messages == ["GET /api 503"]
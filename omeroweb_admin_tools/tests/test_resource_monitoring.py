@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
+
+import pytest
 from django.test import RequestFactory
 
+from omeroweb_admin_tools.views import index_view
 from omeroweb_admin_tools.views.index_view import (
     resource_monitoring_data,
     _build_public_service_url,
@@ -11,11 +15,20 @@ from omeroweb_admin_tools.views.index_view import (
     _load_compose_service_names,
     _proxy_http_request,
     _build_proxy_backend_urls,
+    _build_proxied_response,
     _cookie_path_for_proxy,
     _origin_from_url,
+    _prometheus_instant_query,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_prometheus_query_cache():
+    index_view._PROMETHEUS_QUERY_CACHE.clear()
+    yield
+    index_view._PROMETHEUS_QUERY_CACHE.clear()
+
+
 def test_load_compose_service_names_reads_service_block(tmp_path, monkeypatch) -> None:
     compose_text = """
 services:
@@ -35,6 +48,25 @@ networks:
     assert names == ["app", "db"]
 
 
+def test_load_compose_service_names_rereads_file_after_modification(
+    tmp_path, monkeypatch
+) -> None:
+    compose_file = tmp_path / "docker-compose.yml"
+    compose_file.write_text("services:\n  app:\n    image: test\n", encoding="utf-8")
+    os.utime(compose_file, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.chdir(tmp_path)
+
+    assert _load_compose_service_names() == ["app"]
+
+    compose_file.write_text(
+        "services:\n  app:\n    image: test\n  web:\n    image: test\n",
+        encoding="utf-8",
+    )
+    os.utime(compose_file, ns=(2_000_000_000, 2_000_000_000))
+
+    assert _load_compose_service_names() == ["app", "web"]
+
+
 def test_build_target_service_status_prefers_up() -> None:
     active_targets = [
         {"labels": {"job": "app"}, "health": "down"},
@@ -155,7 +187,9 @@ def test_proxy_http_request_rewrites_origin_headers_when_enabled(monkeypatch) ->
         captured["headers"] = dict(request.header_items())
         return DummyResponse()
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_urlopen
+    )
 
     class DummyDjangoRequest:
         method = "GET"
@@ -199,7 +233,9 @@ def test_proxy_http_request_forwards_post_body(monkeypatch) -> None:
         captured["timeout"] = timeout
         return DummyResponse()
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_urlopen
+    )
 
     class DummyDjangoRequest:
         method = "POST"
@@ -248,7 +284,9 @@ def test_proxy_http_request_forwards_auth_and_cookie_headers(monkeypatch) -> Non
         captured["headers"] = dict(request.header_items())
         return DummyResponse()
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_urlopen
+    )
 
     class DummyDjangoRequest:
         method = "GET"
@@ -293,7 +331,8 @@ def test_proxy_http_request_rewrites_relative_location_header(monkeypatch) -> No
             return b"redirect"
 
     monkeypatch.setattr(
-        "urllib.request.urlopen", lambda request, timeout=10.0: DummyResponse()
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda request, timeout=10.0: DummyResponse(),
     )
 
     class DummyDjangoRequest:
@@ -332,7 +371,8 @@ def test_proxy_http_request_rewrites_non_root_relative_location_header(
             return b"redirect"
 
     monkeypatch.setattr(
-        "urllib.request.urlopen", lambda request, timeout=10.0: DummyResponse()
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda request, timeout=10.0: DummyResponse(),
     )
 
     class DummyDjangoRequest:
@@ -390,8 +430,8 @@ def test_resource_monitoring_data_prefers_public_urls_from_request_host(
     request = RequestFactory().get("/admin_tools/resource-monitoring/data/")
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view._probe_http_url",
@@ -434,7 +474,9 @@ def test_resource_monitoring_data_prefers_public_urls_from_request_host(
             return DummyResponse('{"status": "success", "data": []}')
         raise AssertionError(f"unexpected url: {url}")
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_urlopen
+    )
     monkeypatch.setenv("GRAFANA_HOST_PORT", "3000")
     monkeypatch.setenv("PROMETHEUS_HOST_PORT", "9090")
 
@@ -467,8 +509,8 @@ def test_resource_monitoring_data_keeps_external_urls_optional(monkeypatch) -> N
     request = RequestFactory().get("/admin_tools/resource-monitoring/data/")
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view._probe_http_url",
@@ -514,7 +556,9 @@ def test_resource_monitoring_data_keeps_external_urls_optional(monkeypatch) -> N
             )()
         return DummyResponse()
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_urlopen
+    )
     monkeypatch.setenv(
         "ADMIN_TOOLS_GRAFANA_PUBLIC_URL", "https://monitor.example.org/grafana"
     )
@@ -658,8 +702,8 @@ def test_grafana_proxy_forwards_subpath_and_query(monkeypatch) -> None:
     )
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     captured = {}
@@ -715,8 +759,8 @@ def test_grafana_proxy_root_path_forwards_empty_subpath(monkeypatch) -> None:
     )
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     captured = {}
@@ -768,8 +812,8 @@ def test_prometheus_proxy_root_path_forwards_empty_subpath(monkeypatch) -> None:
     )
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     captured = {}
@@ -872,8 +916,8 @@ def test_grafana_proxy_falls_back_to_public_url_on_backend_unreachable(
     monkeypatch.setenv("ADMIN_TOOLS_GRAFANA_URL", "http://grafana:3000")
     monkeypatch.setenv("ADMIN_TOOLS_GRAFANA_PUBLIC_URL", "http://130.60.107.205:3000")
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     attempts = []
@@ -883,6 +927,9 @@ def test_grafana_proxy_falls_back_to_public_url_on_backend_unreachable(
             self.status_code = status_code
             self.content = b"{}"
 
+        def close(self):
+            pass
+
     def fake_proxy_http_request(
         django_request,
         base_url,
@@ -914,6 +961,60 @@ def test_grafana_proxy_falls_back_to_public_url_on_backend_unreachable(
     assert attempts == ["http://grafana:3000", "http://130.60.107.205:3000"]
 
 
+@pytest.mark.parametrize(
+    ("view_name", "base_env", "public_env"),
+    [
+        ("grafana_proxy", "ADMIN_TOOLS_GRAFANA_URL", "ADMIN_TOOLS_GRAFANA_PUBLIC_URL"),
+        (
+            "prometheus_proxy",
+            "ADMIN_TOOLS_PROMETHEUS_URL",
+            "ADMIN_TOOLS_PROMETHEUS_PUBLIC_URL",
+        ),
+    ],
+)
+def test_proxy_fallback_closes_rejected_backend_response(
+    monkeypatch, view_name, base_env, public_env
+) -> None:
+    from django.http import StreamingHttpResponse
+
+    request = RequestFactory().get("/admin_tools/resource-monitoring/proxy/api/health")
+
+    monkeypatch.setenv(base_env, "http://internal:3000")
+    monkeypatch.setenv(public_env, "http://public:3000")
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
+    )
+
+    closed = []
+    rejected = []
+
+    def rejected_body():
+        try:
+            yield b"bad gateway"
+        finally:
+            closed.append(True)
+
+    def fake_proxy_http_request(django_request, base_url, path, query="", **kwargs):
+        if base_url == "http://internal:3000":
+            response = StreamingHttpResponse(rejected_body(), status=502)
+            next(iter(response.streaming_content))
+            # Hold a reference so only an explicit close() ends the stream.
+            rejected.append(response)
+            return response
+        return StreamingHttpResponse(iter([b"ok"]), status=200)
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view._proxy_http_request",
+        fake_proxy_http_request,
+    )
+
+    response = getattr(index_view, view_name)(request, "api/health", conn=None)
+
+    assert response.status_code == 200
+    assert closed == [True]
+
+
 def test_grafana_proxy_renders_custom_unavailable_page_for_gateway_errors(
     monkeypatch,
 ) -> None:
@@ -924,8 +1025,8 @@ def test_grafana_proxy_renders_custom_unavailable_page_for_gateway_errors(
     monkeypatch.setenv("ADMIN_TOOLS_GRAFANA_URL", "http://grafana:3000")
     monkeypatch.setenv("ADMIN_TOOLS_GRAFANA_PUBLIC_URL", "http://130.60.107.205:3000")
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     class DummyResponse:
@@ -933,6 +1034,9 @@ def test_grafana_proxy_renders_custom_unavailable_page_for_gateway_errors(
             self.status_code = status_code
             self.content = b"{}"
 
+        def close(self):
+            pass
+
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view._proxy_http_request",
         lambda *a, **k: DummyResponse(status_code=502),
@@ -1015,7 +1119,8 @@ def test_proxy_rewrites_app_sub_url_for_grafana(monkeypatch) -> None:
             )
 
     monkeypatch.setattr(
-        "urllib.request.urlopen", lambda req, timeout=10.0: DummyResponse()
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda req, timeout=10.0: DummyResponse(),
     )
 
     class DummyDjangoRequest:
@@ -1057,7 +1162,8 @@ def test_proxy_rewrites_app_url_for_grafana(monkeypatch) -> None:
             )
 
     monkeypatch.setattr(
-        "urllib.request.urlopen", lambda req, timeout=10.0: DummyResponse()
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda req, timeout=10.0: DummyResponse(),
     )
 
     class DummyDjangoRequest:
@@ -1087,8 +1193,8 @@ def test_grafana_proxy_root_redirects_to_default_dashboard(monkeypatch) -> None:
     )
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     def fail_if_called(*args, **kwargs):
@@ -1116,8 +1222,8 @@ def test_resource_monitoring_suppresses_external_url_behind_proxy(monkeypatch) -
         HTTP_X_FORWARDED_HOST="omero.core.uzh.ch",
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view._probe_http_url",
@@ -1159,7 +1265,9 @@ def test_resource_monitoring_suppresses_external_url_behind_proxy(monkeypatch) -
             return R('{"status": "success", "data": []}')
         raise AssertionError(url)
 
-    monkeypatch.setattr("urllib.request.urlopen", fake)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake
+    )
     monkeypatch.setenv("GRAFANA_HOST_PORT", "3000")
     monkeypatch.delenv("ADMIN_TOOLS_GRAFANA_PUBLIC_URL", raising=False)
 
@@ -1200,7 +1308,8 @@ def test_proxy_rewrites_set_cookie_path_for_grafana(monkeypatch) -> None:
             return b"<html><body>ok</body></html>"
 
     monkeypatch.setattr(
-        "urllib.request.urlopen", lambda req, timeout=10.0: DummyResponse()
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda req, timeout=10.0: DummyResponse(),
     )
 
     class DummyDjangoRequest:
@@ -1221,3 +1330,471 @@ def test_proxy_rewrites_set_cookie_path_for_grafana(monkeypatch) -> None:
         response.cookies["grafana_session"]["path"]
         == "/omeroweb_admin_tools/resource-monitoring/grafana-proxy/"
     )
+
+
+def test_build_proxied_response_rewrites_html_in_single_pass() -> None:
+    from http.client import HTTPMessage
+
+    headers = HTTPMessage()
+    headers["Content-Type"] = "text/html; charset=utf-8"
+    payload = (
+        b"<a href=\"/a\"></a><a href='/b'></a><img src=\"/c.png\">"
+        b"<form action='/d'></form><a href=\"login\"></a><a href='login'></a>"
+        b"<script src=\"http://grafana:3000/public/app.js\"></script>"
+    )
+
+    response = _build_proxied_response(
+        payload,
+        status_code=200,
+        headers=headers,
+        base_url="http://grafana:3000/",
+        proxy_prefix="/proxy",
+    )
+
+    assert response.content.decode("utf-8") == (
+        "<a href=\"/proxy/a\"></a><a href='/proxy/b'></a><img src=\"/proxy/c.png\">"
+        "<form action='/proxy/d'></form><a href=\"/proxy/login\"></a>"
+        "<a href='/proxy/login'></a>"
+        "<script src=\"/proxy/public/app.js\"></script>"
+    )
+
+
+def test_proxy_http_request_streams_non_html_payload(monkeypatch) -> None:
+    from http.client import HTTPMessage
+
+    from django.http import StreamingHttpResponse
+
+    headers = HTTPMessage()
+    headers["Content-Type"] = "application/json"
+    body = b'{"status": "success"}' * 8192
+    closed = []
+
+    class DummyResponse:
+        status = 200
+
+        def __init__(self):
+            self.headers = headers
+            self.offset = 0
+
+        def read(self, size=-1):
+            chunk = body[self.offset : self.offset + size]
+            self.offset += len(chunk)
+            return chunk
+
+        def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda req, timeout=10.0: DummyResponse(),
+    )
+
+    class DummyDjangoRequest:
+        method = "GET"
+        body = b""
+        headers = {}
+
+    response = _proxy_http_request(
+        DummyDjangoRequest(),
+        "http://prometheus:9090",
+        "api/v1/query",
+        proxy_prefix="/omeroweb_admin_tools/resource-monitoring/prometheus-proxy",
+    )
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert not closed
+    assert b"".join(response.streaming_content) == body
+    assert closed == [True]
+
+
+def test_prometheus_instant_query_reuses_cached_payload_within_ttl(
+    monkeypatch,
+) -> None:
+    calls = []
+
+    class DummyResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def read(self):
+            return b'{"status": "success", "data": {"result": [{"value": [0, "42.5"]}]}}'
+
+    def fake_open_backend_url(url, timeout=5.0):
+        calls.append(url)
+        return DummyResponse()
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_open_backend_url
+    )
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.time.monotonic", lambda: clock[0]
+    )
+
+    assert _prometheus_instant_query("http://prometheus:9090", "up") == 42.5
+    assert _prometheus_instant_query("http://prometheus:9090", "up") == 42.5
+    assert len(calls) == 1
+
+    clock[0] += index_view.PROMETHEUS_QUERY_CACHE_TTL_SECONDS
+    assert _prometheus_instant_query("http://prometheus:9090", "up") == 42.5
+    assert len(calls) == 2
+
+
+def test_collect_system_metrics_keeps_other_metrics_when_one_query_fails(
+    monkeypatch,
+) -> None:
+    def fake_instant_query(prometheus_base_url, expr):
+        if "node_network_transmit_bytes_total" in expr:
+            raise OSError("connection refused")
+        return 1.5
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view._prometheus_instant_query",
+        fake_instant_query,
+    )
+
+    metrics = index_view._collect_system_metrics("http://prometheus:9090")
+
+    assert metrics == {
+        "cpu_usage_percent": 1.5,
+        "memory_usage_percent": 1.5,
+        "disk_usage_percent": 1.5,
+        "network_receive_bps": 1.5,
+        "network_transmit_bps": None,
+    }
+
+
+def test_build_proxied_response_preserves_non_utf8_bytes() -> None:
+    from http.client import HTTPMessage
+
+    headers = HTTPMessage()
+    headers["Content-Type"] = "text/html; charset=iso-8859-1"
+
+    response = _build_proxied_response(
+        b'<a href="/caf\xe9">caf\xe9</a>',
+        status_code=200,
+        headers=headers,
+        base_url="http://grafana:3000",
+        proxy_prefix="/proxy",
+    )
+
+    assert response.content == b'<a href="/proxy/caf\xe9">caf\xe9</a>'
+
+
+def test_proxy_http_request_forwards_only_allow_listed_headers(monkeypatch) -> None:
+    from http.client import HTTPMessage
+
+    captured = {}
+    response_headers = HTTPMessage()
+    response_headers["Content-Type"] = "text/plain"
+
+    class DummyResponse:
+        status = 200
+        headers = response_headers
+
+        def read(self, size=-1):
+            return b""
+
+        def close(self):
+            return None
+
+    def fake_open_backend_url(request, timeout=10.0):
+        captured["headers"] = dict(request.header_items())
+        return DummyResponse()
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url", fake_open_backend_url
+    )
+    django_request = RequestFactory().get(
+        "/",
+        HTTP_AUTHORIZATION="Bearer token",
+        HTTP_ACCEPT="application/json",
+        HTTP_X_FORWARDED_FOR="10.0.0.1",
+    )
+
+    _proxy_http_request(django_request, "http://grafana:3000", "api/health")
+
+    assert captured["headers"] == {
+        "Authorization": "Bearer token",
+        "Accept": "application/json",
+    }
+
+
+def test_copy_set_cookie_headers_preserves_cookie_attributes() -> None:
+    from http.client import HTTPMessage
+
+    from django.http import HttpResponse
+
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = (
+        "grafana_session=abc123; Path=/; Max-Age=600; HttpOnly; SameSite=Lax"
+    )
+    headers["Set-Cookie"] = (
+        "redirect_to=%2F; Path=/login; Expires=Wed, 21 Oct 2015 07:28:00 GMT; Secure"
+    )
+    response = HttpResponse()
+
+    index_view._copy_set_cookie_headers(headers, response, "/proxy")
+
+    session = response.cookies["grafana_session"]
+    assert session.value == "abc123"
+    assert session["path"] == "/proxy/"
+    assert session["max-age"] == 600
+    assert session["httponly"] is True
+    assert session["samesite"] == "Lax"
+    redirect = response.cookies["redirect_to"]
+    assert redirect["path"] == "/proxy/login"
+    assert redirect["expires"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert redirect["secure"] is True
+
+
+def test_copy_set_cookie_headers_skips_malformed_cookies() -> None:
+    from http.client import HTTPMessage
+
+    from django.http import HttpResponse
+
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "bad name@host=1; Path=/"
+    headers["Set-Cookie"] = "odd_site=1; Path=/; SameSite=Sometimes"
+    headers["Set-Cookie"] = "grafana_session=abc123; Path=/; HttpOnly"
+    response = HttpResponse()
+
+    index_view._copy_set_cookie_headers(headers, response, "/proxy")
+
+    assert list(response.cookies) == ["grafana_session"]
+    assert response.cookies["grafana_session"]["path"] == "/proxy/"
+
+
+def test_proxy_http_request_rewrites_html_split_across_chunks(monkeypatch) -> None:
+    from http.client import HTTPMessage
+
+    headers = HTTPMessage()
+    headers["Content-Type"] = "text/html; charset=utf-8"
+    body = (
+        b"<html>" + b"x" * 5000 + b'<a href="/d/home">home</a>'
+        b'<script>{"appSubUrl":"","appUrl":"http://grafana:3000/"}</script></html>'
+    )
+
+    class DummyResponse:
+        status = 200
+
+        def __init__(self):
+            self.headers = headers
+            self.offset = 0
+
+        def read(self, size=-1):
+            # Odd read sizes make the rewrite targets straddle chunk borders.
+            chunk = body[self.offset : self.offset + 7]
+            self.offset += len(chunk)
+            return chunk
+
+        def close(self):
+            return None
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.open_backend_url",
+        lambda req, timeout=10.0: DummyResponse(),
+    )
+
+    class DummyDjangoRequest:
+        method = "GET"
+        body = b""
+        headers = {}
+
+    response = _proxy_http_request(
+        DummyDjangoRequest(),
+        "http://grafana:3000",
+        "d/home",
+        proxy_prefix="/proxy",
+    )
+
+    content = b"".join(response.streaming_content)
+    assert content.startswith(b"<html>" + b"x" * 5000)
+    assert content.endswith(
+        b'<a href="/proxy/d/home">home</a>'
+        b'<script>{"appSubUrl":"/proxy","appUrl":"/proxy/"}</script></html>'
+    )
+
+
+def test_docker_container_list_is_shared_between_health_and_diagnostics(
+    monkeypatch,
+) -> None:
+    calls = []
+    containers = [
+        {
+            "Id": "abc",
+            "State": "running",
+            "Status": "Up 5 minutes (healthy)",
+            "Labels": {"com.docker.compose.service": "omeroweb"},
+        }
+    ]
+
+    def fake_docker_api_json(path, timeout_seconds=3.0):
+        calls.append(path)
+        return containers
+
+    monkeypatch.setattr(index_view, "_DOCKER_CONTAINER_LIST_CACHE", None)
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view._docker_api_json", fake_docker_api_json
+    )
+
+    healthcheck_config, runtime_health = index_view._load_compose_health_data()
+    diagnostics = index_view._diagnose_docker_health()
+
+    assert calls == ["/containers/json?all=1"]
+    assert healthcheck_config == {"omeroweb": True}
+    assert runtime_health == {"omeroweb": {"state": "running", "health": "healthy"}}
+    assert diagnostics["container_count"] == 1
+
+
+def test_docker_api_json_reuses_keep_alive_socket(monkeypatch, tmp_path) -> None:
+    import json
+    import socketserver
+    import threading
+    from http.server import BaseHTTPRequestHandler
+
+    accepted = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            accepted.append(self.request)
+            super().setup()
+
+        def address_string(self):
+            return "docker.sock"
+
+        def do_GET(self):
+            body = json.dumps({"path": self.path}).encode("utf-8")
+            self.send_response(404 if self.path == "/missing" else 200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            return None
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    socket_path = str(tmp_path / "docker.sock")
+    server = Server(socket_path, Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("ADMIN_TOOLS_DOCKER_SOCKET", socket_path)
+    monkeypatch.setattr(index_view, "_DOCKER_IDLE_CONNECTIONS", [])
+    try:
+        assert index_view._docker_api_json("/info") == {"path": "/info"}
+        assert index_view._docker_api_json("/missing") is None
+        assert index_view._docker_api_json("/version") == {"path": "/version"}
+        assert len(accepted) == 1
+
+        # An idle socket closed by the daemon is replaced transparently.
+        index_view._DOCKER_IDLE_CONNECTIONS[0].sock.shutdown(2)
+        assert index_view._docker_api_json("/info") == {"path": "/info"}
+        assert len(accepted) == 2
+    finally:
+        for connection in index_view._DOCKER_IDLE_CONNECTIONS:
+            connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_compose_health_inspects_run_concurrently(monkeypatch) -> None:
+    import threading
+
+    containers = [
+        {
+            "Id": container_id,
+            "State": "running",
+            "Status": "Up 2 minutes",
+            "Labels": {"com.docker.compose.service": service},
+        }
+        for container_id, service in (("c1", "database"), ("c2", "redis"))
+    ]
+    inspect_payloads = {
+        "c1": {
+            "Config": {"Healthcheck": {"Test": ["CMD", "pg_isready"]}},
+            "State": {"Health": {"Status": "starting"}},
+        },
+        "c2": {"Config": {}, "State": {}},
+    }
+    # Both inspects must be in flight at once to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_docker_api_json(path, timeout_seconds=3.0):
+        if path == "/containers/json?all=1":
+            return containers
+        barrier.wait()
+        return inspect_payloads[path.split("/")[2]]
+
+    monkeypatch.setattr(index_view, "_DOCKER_CONTAINER_LIST_CACHE", None)
+    monkeypatch.setattr(index_view, "_docker_api_json", fake_docker_api_json)
+
+    healthcheck_config, runtime_health = index_view._load_compose_health_data()
+
+    assert healthcheck_config == {"database": True, "redis": False}
+    assert runtime_health == {
+        "database": {"state": "running", "health": "starting"},
+        "redis": {"state": "running", "health": ""},
+    }
+
+
+def test_docker_container_list_keeps_only_summary_fields(monkeypatch) -> None:
+    container = {
+        "Id": "abc",
+        "State": "running",
+        "Status": "Up 1 minute (healthy)",
+        "Labels": {"com.docker.compose.service": "omeroweb", "maintainer": "x"},
+        "Mounts": [{"Source": "/data"}],
+        "NetworkSettings": {"Networks": {}},
+    }
+    monkeypatch.setattr(index_view, "_DOCKER_CONTAINER_LIST_CACHE", None)
+    monkeypatch.setattr(
+        index_view, "_docker_api_json", lambda path, timeout_seconds=3.0: [container]
+    )
+
+    assert index_view._docker_container_list() == [
+        {
+            "Id": "abc",
+            "State": "running",
+            "Status": "Up 1 minute (healthy)",
+            "Labels": {"com.docker.compose.service": "omeroweb"},
+        }
+    ]
+
+
+def test_docker_diagnostics_samples_require_env_flag(monkeypatch) -> None:
+    containers = [
+        {
+            "Id": "abc",
+            "State": "running",
+            "Status": "Up 5 minutes (healthy)",
+            "Labels": {"com.docker.compose.service": "omeroweb"},
+        }
+    ]
+    monkeypatch.setattr(index_view, "_docker_container_list", lambda: containers)
+
+    monkeypatch.delenv("ADMIN_TOOLS_DOCKER_DIAGNOSTICS", raising=False)
+    diagnostics = index_view._diagnose_docker_health()
+    assert diagnostics["api_reachable"] is True
+    assert diagnostics["containers_with_health"] == 1
+    assert diagnostics["sample_statuses"] == []
+    assert diagnostics["current_uid"] == -1
+
+    monkeypatch.setenv("ADMIN_TOOLS_DOCKER_DIAGNOSTICS", "true")
+    diagnostics = index_view._diagnose_docker_health()
+    assert diagnostics["sample_statuses"] == [
+        {
+            "service": "omeroweb",
+            "state": "running",
+            "status": "Up 5 minutes (healthy)",
+            "parsed_health": "healthy",
+        }
+    ]
+    assert diagnostics["current_uid"] == os.getuid()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from django.test import RequestFactory
+
+from omeroweb_admin_tools.views import utils as view_utils
+from omeroweb_admin_tools.views.utils import ROOT_CHECK_SESSION_KEY, is_root_user
+
+
+def _request_with_session():
+    request = RequestFactory().get("/admin_tools/")
+    request.session = {}
+    return request
+
+
+def _conn(session_key="session-a"):
+    return SimpleNamespace(getSessionId=lambda: session_key)
+
+
+def test_is_root_user_caches_positive_check_on_session(monkeypatch) -> None:
+    calls = []
+
+    def _username(request, conn):
+        calls.append(conn)
+        return "root"
+
+    monkeypatch.setattr(view_utils, "current_username", _username)
+    request = _request_with_session()
+    conn = _conn()
+
+    assert is_root_user(request, conn=conn) is True
+    assert is_root_user(request, conn=conn) is True
+    assert len(calls) == 1
+    assert request.session[ROOT_CHECK_SESSION_KEY]["omero_session"] == "session-a"
+
+
+def test_is_root_user_rechecks_for_a_different_omero_session(monkeypatch) -> None:
+    usernames = {"session-a": "root", "session-b": "alice"}
+    monkeypatch.setattr(
+        view_utils,
+        "current_username",
+        lambda request, conn: usernames[conn.getSessionId()],
+    )
+    request = _request_with_session()
+
+    assert is_root_user(request, conn=_conn("session-a")) is True
+    assert is_root_user(request, conn=_conn("session-b")) is False
+    assert ROOT_CHECK_SESSION_KEY not in request.session
+
+
+def test_is_root_user_does_not_cache_without_session_key(monkeypatch) -> None:
+    calls = []
+
+    def _username(request, conn):
+        calls.append(conn)
+        return "root"
+
+    monkeypatch.setattr(view_utils, "current_username", _username)
+    request = _request_with_session()
+
+    assert is_root_user(request, conn=None) is True
+    assert is_root_user(request, conn=None) is True
+    assert len(calls) == 2
+    assert ROOT_CHECK_SESSION_KEY not in request.session
+
+
+def test_is_root_user_rechecks_after_ttl_expiry(monkeypatch) -> None:
+    monkeypatch.setattr(view_utils, "current_username", lambda request, conn: "root")
+    request = _request_with_session()
+    request.session[ROOT_CHECK_SESSION_KEY] = {
+        "omero_session": "session-a",
+        "until": 0.0,
+    }
+
+    assert is_root_user(request, conn=_conn()) is True
+    assert request.session[ROOT_CHECK_SESSION_KEY]["until"] > 0.0
+
+
+def test_is_root_user_does_not_cache_negative_check(monkeypatch) -> None:
+    monkeypatch.setattr(view_utils, "current_username", lambda request, conn: "alice")
+    request = _request_with_session()
+
+    assert is_root_user(request, conn=None) is False
+    assert ROOT_CHECK_SESSION_KEY not in request.session
+
+
+def test_require_root_user_rejects_non_root(monkeypatch) -> None:
+    monkeypatch.setattr(view_utils, "current_username", lambda request, conn: "alice")
+
+    @view_utils.require_root_user
+    def _view(request, conn=None, url=None, **kwargs):
+        return SimpleNamespace(status_code=200)
+
+    response = _view(_request_with_session(), conn=None)
+
+    assert response.status_code == 403
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(response.content) == {
+        "error": "PLEASE LOGIN AS ROOT USER\nTO USE THIS PLUGIN"
+    }
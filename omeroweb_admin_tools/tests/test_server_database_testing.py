@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 
 from django.test import RequestFactory
 
@@ -10,8 +11,8 @@ from omeroweb_admin_tools.views.index_view import server_database_testing_run
 def test_server_database_testing_run_requires_post(monkeypatch) -> None:
     request = RequestFactory().get("/admin_tools/server-database-testing/run/")
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     response = server_database_testing_run(request, conn=None)
@@ -26,8 +27,8 @@ def test_server_database_testing_run_rejects_empty_script_ids(monkeypatch) -> No
         content_type="application/json",
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
 
     response = server_database_testing_run(request, conn=None)
@@ -44,8 +45,8 @@ def test_server_database_testing_run_returns_results(monkeypatch) -> None:
         content_type="application/json",
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.run_diagnostic_script",
@@ -61,3 +62,32 @@ def test_server_database_testing_run_returns_results(monkeypatch) -> None:
     ]
     assert isinstance(payload["request_id"], str)
     assert payload["request_id"]
+
+
+def test_server_database_testing_run_runs_scripts_concurrently(monkeypatch) -> None:
+    script_ids = ["omero_server_core", "omero_database", "plugin_database"]
+    request = RequestFactory().post(
+        "/admin_tools/server-database-testing/run/",
+        data=json.dumps({"scripts": script_ids}),
+        content_type="application/json",
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
+    )
+    # Every script waits for the others, so a sequential run would time out.
+    barrier = threading.Barrier(len(script_ids), timeout=5)
+
+    def fake_run(script_id):
+        barrier.wait()
+        return {"script_id": script_id, "status": "pass", "checks": []}
+
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.run_diagnostic_script", fake_run
+    )
+
+    response = server_database_testing_run(request, conn=None)
+
+    assert response.status_code == 200
+    payload = json.loads(response.content.decode("utf-8"))
+    assert [item["script_id"] for item in payload["results"]] == script_ids
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import RequestFactory
 
+from omeroweb_admin_tools.services import storage_quotas
 from omeroweb_admin_tools.services.storage_quotas import (
     AUTO_GROUP_QUOTA_ENV,
     DEFAULT_GROUP_QUOTA_ENV,
@@ -23,6 +26,7 @@ from omeroweb_admin_tools.services.storage_quotas import (
     upsert_quotas,
 )
 from omeroweb_admin_tools.views.index_view import (
+    storage_data,
     storage_quota_import,
     storage_quota_template,
     storage_quota_update,
@@ -31,13 +35,6 @@ from omeroweb_admin_tools.views.index_view import (
 import pytest
 
 
-@pytest.fixture(autouse=True)
-def _set_required_quota_env(monkeypatch) -> None:
-    monkeypatch.setenv(MIN_GROUP_QUOTA_ENV, "0.10")
-    monkeypatch.setenv(DEFAULT_GROUP_QUOTA_ENV, "0.10")
-    monkeypatch.setenv(AUTO_GROUP_QUOTA_ENV, "false")
-
-
 def test_quota_csv_template_headers() -> None:
     assert quota_csv_template() == "Group,Quota [GB]\n"
 
@@ -183,6 +180,30 @@ def test_upsert_does_not_repeat_log_for_unchanged_quota(tmp_path, monkeypatch) -
     ]
 
 
+def test_upsert_applies_batch_with_single_write(tmp_path, monkeypatch) -> None:
+    state_path = tmp_path / "quotas.json"
+    monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
+    writes = []
+    original_write_state = storage_quotas._write_state
+
+    def _counting_write_state(path, state):
+        writes.append(path)
+        original_write_state(path, state)
+
+    monkeypatch.setattr(storage_quotas, "_write_state", _counting_write_state)
+
+    state = upsert_quotas(
+        iter([("group-a", 1), ("group-b", 2), ("group-a", 3)]), source="csv"
+    )
+
+    assert len(writes) == 1
+    assert state["quotas_gb"] == {"group-a": 3.0, "group-b": 2.0}
+    group_a_logs = [
+        entry for entry in state["logs"] if "group 'group-a'" in entry["message"]
+    ]
+    assert len(group_a_logs) == 1
+
+
 def test_upsert_rejects_quota_below_minimum(tmp_path, monkeypatch) -> None:
     state_path = tmp_path / "quotas.json"
     monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
@@ -347,8 +368,8 @@ def test_storage_quota_update_endpoint(monkeypatch) -> None:
         content_type="application/json",
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.upsert_quotas",
@@ -373,8 +394,8 @@ def test_storage_quota_update_endpoint_accepts_empty_body(monkeypatch) -> None:
         content_type="application/json",
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.upsert_quotas",
@@ -397,8 +418,8 @@ def test_storage_quota_update_endpoint_accepts_form_encoded_updates(monkeypatch)
         data={"updates": json.dumps([{"group": "demo", "quota_gb": 0.5}])},
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.upsert_quotas",
@@ -449,6 +470,26 @@ def test_upsert_recovers_from_non_object_state_file(tmp_path, monkeypatch) -> No
     assert payload["quotas_gb"]["group-a"] == 5.0
 
 
+def test_concurrent_upserts_do_not_lose_updates(tmp_path, monkeypatch) -> None:
+    """Parallel writers serialize on the state lock instead of clobbering each other."""
+    state_path = tmp_path / "quotas.json"
+    monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
+    groups = [f"group-{index}" for index in range(10)]
+
+    threads = [
+        threading.Thread(target=upsert_quotas, args=([(group, 1)],))
+        for group in groups
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    payload = json.loads(state_path.read_text(encoding="utf-8"))
+    assert sorted(payload["quotas_gb"]) == sorted(groups)
+    assert state_path.with_suffix(".json.lock").exists()
+
+
 def test_storage_quota_update_returns_500_on_state_file_error(monkeypatch) -> None:
     """When upsert_quotas raises, the view should return 500 not 400."""
     request = RequestFactory().post(
@@ -457,8 +498,8 @@ def test_storage_quota_update_returns_500_on_state_file_error(monkeypatch) -> No
         content_type="application/json",
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.upsert_quotas",
@@ -493,8 +534,8 @@ def test_storage_quota_update_endpoint_multipart_form(monkeypatch) -> None:
         data={"updates": json.dumps([{"group": "demo", "quota_gb": 0.5}])},
     )
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.upsert_quotas",
@@ -521,8 +562,8 @@ def test_storage_quota_import_and_template_endpoints(monkeypatch) -> None:
     )
 
     monkeypatch.setattr(
-        "omeroweb_admin_tools.views.index_view._require_root_user",
-        lambda request, conn: None,
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
     )
     monkeypatch.setattr(
         "omeroweb_admin_tools.views.index_view.import_quotas_csv",
@@ -541,6 +582,47 @@ def test_storage_quota_import_and_template_endpoints(monkeypatch) -> None:
     assert b"Group,Quota [GB]" in template_response.content
 
 
+def _root_conn() -> SimpleNamespace:
+    return SimpleNamespace(getUser=lambda: SimpleNamespace(getName=lambda: "root"))
+
+
+def test_storage_quota_import_rejects_oversized_upload(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.QUOTA_CSV_MAX_BYTES", 16
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.import_quotas_csv",
+        lambda content: pytest.fail("oversized upload must not be parsed"),
+    )
+    upload = SimpleUploadedFile(
+        "quotas.csv", b"Group,Quota [GB]\ndemo,12\n", content_type="text/csv"
+    )
+    request = RequestFactory().post(
+        "/omeroweb_admin_tools/storage/quota/import/", data={"file": upload}
+    )
+
+    response = storage_quota_import(request, conn=_root_conn())
+
+    assert response.status_code == 413
+
+
+def test_storage_quota_import_rejects_binary_upload(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.import_quotas_csv",
+        lambda content: pytest.fail("binary upload must not be parsed"),
+    )
+    upload = SimpleUploadedFile(
+        "quotas.csv", b"Group,Quota [GB]\n\x00\x01demo,12\n", content_type="text/csv"
+    )
+    request = RequestFactory().post(
+        "/omeroweb_admin_tools/storage/quota/import/", data={"file": upload}
+    )
+
+    response = storage_quota_import(request, conn=_root_conn())
+
+    assert response.status_code == 415
+
+
 def test_managed_repository_compatibility_requires_group_user_prefix(
     monkeypatch,
 ) -> None:
@@ -678,3 +760,178 @@ def test_reconcile_marks_group_as_applied_when_directory_exists(
     assert any(
         "Host-side enforcer will apply" in entry["message"] for entry in result["logs"]
     )
+
+
+def test_storage_data_aggregates_user_group_rows(monkeypatch, tmp_path) -> None:
+    rows = [
+        [1, "alice", 10, "lab", 300],
+        [1, "alice", 11, "core", 100],
+        [2, "bob", 10, "lab", 50],
+    ]
+    conn = SimpleNamespace(
+        getUser=lambda: SimpleNamespace(getName=lambda: "root"),
+        SERVICE_OPTS=SimpleNamespace(),
+        getQueryService=lambda: SimpleNamespace(
+            projection=lambda query, params, service_opts: rows
+        ),
+    )
+    monkeypatch.setenv("OMERO_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view._list_all_users_and_groups",
+        lambda conn: (
+            {"alice": "Alice A", "bob": "Bob B", "carol": "Carol C"},
+            {"lab", "core", "empty"},
+            {"lab": "Read-Only"},
+            {"carol": {"empty"}},
+            {"empty": {"carol"}},
+        ),
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.reconcile_quotas",
+        lambda groups: {"quotas_gb": {}, "logs": []},
+    )
+
+    response = storage_data(RequestFactory().get("/storage/data/"), conn=conn)
+
+    assert response.status_code == 200
+    payload = json.loads(response.content)
+    assert payload["totals"]["omero_binary_bytes"] == 450
+    assert payload["by_user"] == [
+        {
+            "username": "alice",
+            "full_name": "Alice A",
+            "groups": ["core", "lab"],
+            "bytes": 400,
+        },
+        {"username": "bob", "full_name": "Bob B", "groups": ["lab"], "bytes": 50},
+        {"username": "carol", "full_name": "Carol C", "groups": ["empty"], "bytes": 0},
+    ]
+    assert payload["by_group"] == [
+        {
+            "group": "lab",
+            "users": ["alice", "bob"],
+            "permissions": "Read-Only",
+            "bytes": 350,
+        },
+        {"group": "core", "users": ["alice"], "permissions": "Private", "bytes": 100},
+        {"group": "empty", "users": ["carol"], "permissions": "Private", "bytes": 0},
+    ]
+    assert payload["by_user_group"][0] == {
+        "username": "alice",
+        "group": "lab",
+        "bytes": 300,
+    }
+
+
+def test_storage_data_serves_cached_payload_until_quota_update(
+    monkeypatch, tmp_path
+) -> None:
+    projection_calls = []
+
+    def projection(query, params, service_opts):
+        projection_calls.append(query)
+        return [[1, "alice", 10, "lab", 300]]
+
+    conn = SimpleNamespace(
+        getUser=lambda: SimpleNamespace(getName=lambda: "root"),
+        SERVICE_OPTS=SimpleNamespace(),
+        getQueryService=lambda: SimpleNamespace(projection=projection),
+    )
+    monkeypatch.setenv("OMERO_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view._list_all_users_and_groups",
+        lambda conn: ({"alice": "Alice A"}, {"lab"}, {}, {}, {}),
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.reconcile_quotas",
+        lambda groups: {"quotas_gb": {}, "logs": []},
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.upsert_quotas",
+        lambda updates, source: {"quotas_gb": {"lab": 15.0}},
+    )
+
+    first = storage_data(RequestFactory().get("/storage/data/"), conn=conn)
+    second = storage_data(RequestFactory().get("/storage/data/"), conn=conn)
+
+    assert first.status_code == 200
+    assert second.content == first.content
+    assert second["ETag"] == first["ETag"]
+    assert len(projection_calls) == 1
+
+    not_modified = storage_data(
+        RequestFactory().get("/storage/data/", HTTP_IF_NONE_MATCH=first["ETag"]),
+        conn=conn,
+    )
+    assert not_modified.status_code == 304
+    assert len(projection_calls) == 1
+
+    update_request = RequestFactory().post(
+        "/omeroweb_admin_tools/storage/quota/update/",
+        data=json.dumps({"updates": [{"group": "lab", "quota_gb": 15}]}),
+        content_type="application/json",
+    )
+    assert storage_quota_update(update_request, conn=conn).status_code == 200
+
+    storage_data(RequestFactory().get("/storage/data/"), conn=conn)
+    assert len(projection_calls) == 2
+
+
+def test_storage_data_top_limits_breakdowns(monkeypatch, tmp_path) -> None:
+    rows = [
+        [1, "alice", 10, "lab", 300],
+        [2, "bob", 10, "lab", 50],
+        [3, "carol", 11, "core", 100],
+    ]
+    conn = SimpleNamespace(
+        SERVICE_OPTS=SimpleNamespace(),
+        getQueryService=lambda: SimpleNamespace(
+            projection=lambda query, params, service_opts: rows
+        ),
+    )
+    monkeypatch.setenv("OMERO_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.utils.is_root_user",
+        lambda request, conn: True,
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view._list_all_users_and_groups",
+        lambda conn: ({}, set(), {}, {}, {}),
+    )
+    monkeypatch.setattr(
+        "omeroweb_admin_tools.views.index_view.reconcile_quotas",
+        lambda groups: {"quotas_gb": {}, "logs": []},
+    )
+
+    response = storage_data(RequestFactory().get("/storage/data/?top=2"), conn=conn)
+    payload = json.loads(response.content)
+
+    assert payload["totals"]["omero_binary_bytes"] == 450
+    assert [item["username"] for item in payload["by_user"]] == ["alice", "carol"]
+    assert [item["group"] for item in payload["by_group"]] == ["lab", "core"]
+    assert [item["bytes"] for item in payload["by_user_group"]] == [300, 100]
+
+    response = storage_data(RequestFactory().get("/storage/data/?top=0"), conn=conn)
+    assert response.status_code == 400
+
+
+def test_iter_projection_pages_fetches_until_short_page(monkeypatch) -> None:
+    from omeroweb_admin_tools.views import index_view
+
+    class FakeParameters:
+        def page(self, offset, limit):
+            self.offset, self.limit = offset, limit
+
+    requested = []
+
+    def projection(query, params, service_opts):
+        requested.append((params.offset, params.limit))
+        return list(range(10))[params.offset : params.offset + params.limit]
+
+    monkeypatch.setattr(index_view, "ParametersI", FakeParameters)
+    query_service = SimpleNamespace(projection=projection)
+
+    rows = list(index_view._iter_projection_pages(query_service, "q", None, 4))
+
+    assert rows == list(range(10))
+    assert requested == [(0, 4), (4, 4), (8, 4)]
@@ -3,9 +3,6 @@ from __future__ import annotations
 import pytest
 
 from omeroweb_admin_tools.services.storage_quotas import (
-    AUTO_GROUP_QUOTA_ENV,
-    DEFAULT_GROUP_QUOTA_ENV,
-    MIN_GROUP_QUOTA_ENV,
     is_quota_enforcement_available,
     reconcile_quotas,
     resolve_managed_group_root,
@@ -13,13 +10,6 @@ from omeroweb_admin_tools.services.storage_quotas import (
 )
 
 
-@pytest.fixture(autouse=True)
-def _set_required_quota_env(monkeypatch) -> None:
-    monkeypatch.setenv(MIN_GROUP_QUOTA_ENV, "0.10")
-    monkeypatch.setenv(DEFAULT_GROUP_QUOTA_ENV, "0.10")
-    monkeypatch.setenv(AUTO_GROUP_QUOTA_ENV, "false")
-
-
 def test_resolve_managed_group_root_uses_fixed_path_when_present(
     tmp_path, monkeypatch
 ) -> None:
@@ -70,11 +60,11 @@ def test_reconcile_blocks_enforcement_for_unsafe_root(tmp_path, monkeypatch) ->
     )
 
 
-def test_reconcile_includes_detection_reason_in_response(tmp_path, monkeypatch) -> None:
+def test_reconcile_includes_detection_reason_in_response(
+    tmp_path, monkeypatch, prebuilt_safe_root
+) -> None:
     state_path = tmp_path / "quotas.json"
-    safe_root = tmp_path / "safe" / "group-root"
-    safe_root.mkdir(parents=True)
-    (safe_root / "group-a").mkdir()
+    safe_root = prebuilt_safe_root
 
     monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
     monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%group%/%user%/%time%")
@@ -93,147 +83,120 @@ def test_reconcile_includes_detection_reason_in_response(tmp_path, monkeypatch)
     assert result["managed_group_root_reason"] == "unit-test-detected"
 
 
-def test_reconcile_keeps_missing_group_directory_pending(tmp_path, monkeypatch) -> None:
-    """Reconcile never creates missing group directories; it reports pending status."""
-    state_path = tmp_path / "quotas.json"
-    safe_root = tmp_path / "safe" / "group-root"
-    safe_root.mkdir(parents=True)
-
-    monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
-    monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%group%/%user%/%time%")
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas.resolve_managed_group_root",
-        lambda known_groups: (safe_root, "test-override"),
-    )
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas._is_safe_managed_repository_root",
-        lambda path: (True, ""),
-    )
-
-    upsert_quotas([("new-group", 5)])
-    group_dir = safe_root / "new-group"
-    assert not group_dir.exists()
-
-    result = reconcile_quotas(["new-group"])
-
-    assert not group_dir.exists()
-    assert "new-group" not in result["applied_groups"]
-    assert "new-group" in result["pending_groups"]
-    assert any(
-        "Waiting for OMERO.server to create/register the directory" in entry["message"]
-        for entry in result["logs"]
-    )
-
-
-def test_reconcile_keeps_pending_without_known_groups(tmp_path, monkeypatch) -> None:
-    """Reconcile keeps quotas pending when known_groups is empty and directory is absent."""
-    state_path = tmp_path / "quotas.json"
-    safe_root = tmp_path / "safe" / "group-root"
-    safe_root.mkdir(parents=True)
-
-    monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
-    monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%group%/%user%/%time%")
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas.resolve_managed_group_root",
-        lambda known_groups: (safe_root, "test-override"),
-    )
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas._is_safe_managed_repository_root",
-        lambda path: (True, ""),
-    )
-
-    upsert_quotas([("users", 1)])
-    group_dir = safe_root / "users"
-    assert not group_dir.exists()
-
-    result = reconcile_quotas([])
-
-    assert not group_dir.exists()
-    assert "users" not in result["applied_groups"]
-    assert "users" in result["pending_groups"]
-
-
-def test_reconcile_skips_directory_creation_when_root_unsafe(
-    tmp_path, monkeypatch
+COMPATIBLE_REPO_TEMPLATE = "%group%/%user%/%time%"
+
+
+@pytest.mark.parametrize(
+    (
+        "group_name",
+        "repo_template",
+        "root_is_safe",
+        "known_groups",
+        "expected_bucket",
+        "expected_log_fragment",
+    ),
+    [
+        pytest.param(
+            "new-group",
+            COMPATIBLE_REPO_TEMPLATE,
+            True,
+            ["new-group"],
+            "pending_groups",
+            "Waiting for OMERO.server to create/register the directory",
+            id="missing-directory-stays-pending",
+        ),
+        pytest.param(
+            "users",
+            COMPATIBLE_REPO_TEMPLATE,
+            True,
+            [],
+            "pending_groups",
+            None,
+            id="pending-without-known-groups",
+        ),
+        pytest.param(
+            "some-group",
+            COMPATIBLE_REPO_TEMPLATE,
+            False,
+            [],
+            "pending_groups",
+            None,
+            id="root-unsafe",
+        ),
+        pytest.param(
+            "some-group",
+            "%user%/%group%/%time%",
+            True,
+            [],
+            "pending_groups",
+            None,
+            id="template-incompatible",
+        ),
+        pytest.param(
+            "existing-group",
+            COMPATIBLE_REPO_TEMPLATE,
+            True,
+            ["existing-group"],
+            "applied_groups",
+            None,
+            id="directory-already-exists",
+        ),
+    ],
+)
+def test_reconcile_reports_group_status_without_creating_directories(
+    tmp_path,
+    monkeypatch,
+    prebuilt_safe_root,
+    group_name,
+    repo_template,
+    root_is_safe,
+    known_groups,
+    expected_bucket,
+    expected_log_fragment,
 ) -> None:
-    """Directory is never created when managed repository root is unsafe."""
-    state_path = tmp_path / "quotas.json"
-    unsafe_root = tmp_path / "unsafe"
-    unsafe_root.mkdir(parents=True)
-
-    monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
-    monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%group%/%user%/%time%")
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas.resolve_managed_group_root",
-        lambda known_groups: (unsafe_root, "test-unsafe"),
-    )
+    """Reconcile never creates group directories; it only reports their status.
 
-    upsert_quotas([("some-group", 5)])
-    result = reconcile_quotas([])
-
-    assert not (unsafe_root / "some-group").exists()
-    assert "some-group" in result["pending_groups"]
-
-
-def test_reconcile_skips_directory_creation_when_template_incompatible(
-    tmp_path, monkeypatch
-) -> None:
-    """Directory is never created when repository template is incompatible."""
+    Unsafe cases use the real safety check, which rejects the prebuilt root
+    because it lives outside the (per-test) OMERO data directory.
+    """
     state_path = tmp_path / "quotas.json"
-    safe_root = tmp_path / "safe" / "group-root"
-    safe_root.mkdir(parents=True)
+    group_dir = prebuilt_safe_root / group_name
+    directory_existed = group_dir.exists()
 
     monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
-    monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%user%/%group%/%time%")
+    monkeypatch.setenv("OMERO_DATA_DIR", str(tmp_path / "OMERO"))
+    monkeypatch.setenv("CONFIG_omero_fs_repo_path", repo_template)
     monkeypatch.setattr(
         "omeroweb_admin_tools.services.storage_quotas.resolve_managed_group_root",
-        lambda known_groups: (safe_root, "test-override"),
+        lambda known_groups: (prebuilt_safe_root, "test-override"),
     )
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas._is_safe_managed_repository_root",
-        lambda path: (True, ""),
-    )
-
-    upsert_quotas([("some-group", 5)])
-    result = reconcile_quotas([])
+    if root_is_safe:
+        monkeypatch.setattr(
+            "omeroweb_admin_tools.services.storage_quotas._is_safe_managed_repository_root",
+            lambda path: (True, ""),
+        )
 
-    assert not (safe_root / "some-group").exists()
-    assert "some-group" in result["pending_groups"]
+    upsert_quotas([(group_name, 5)])
+    result = reconcile_quotas(known_groups)
 
-
-def test_reconcile_reports_configured_when_directory_already_exists(tmp_path, monkeypatch) -> None:
-    """Existing directory is reported as configured."""
-    state_path = tmp_path / "quotas.json"
-    safe_root = tmp_path / "safe" / "group-root"
-    safe_root.mkdir(parents=True)
-    (safe_root / "existing-group").mkdir()
-
-    monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
-    monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%group%/%user%/%time%")
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas.resolve_managed_group_root",
-        lambda known_groups: (safe_root, "test-override"),
-    )
-    monkeypatch.setattr(
-        "omeroweb_admin_tools.services.storage_quotas._is_safe_managed_repository_root",
-        lambda path: (True, ""),
+    other_bucket = (
+        "applied_groups" if expected_bucket == "pending_groups" else "pending_groups"
     )
-
-    upsert_quotas([("existing-group", 5)])
-    result = reconcile_quotas(["existing-group"])
-
-    assert "existing-group" in result["applied_groups"]
+    assert group_dir.exists() is directory_existed
+    assert group_name in result[expected_bucket]
+    assert group_name not in result[other_bucket]
+    if expected_log_fragment:
+        assert any(
+            expected_log_fragment in entry["message"] for entry in result["logs"]
+        )
 
 
 def test_reconcile_reports_configured_status_for_ready_groups(
-    tmp_path, monkeypatch
+    tmp_path, monkeypatch, prebuilt_safe_root
 ) -> None:
     """Groups with quota + existing directory are reported as configured (applied)."""
     state_path = tmp_path / "quotas.json"
-    safe_root = tmp_path / "safe" / "group-root"
-    safe_root.mkdir(parents=True)
-    (safe_root / "group-a").mkdir()
-    (safe_root / "group-b").mkdir()
+    safe_root = prebuilt_safe_root
 
     monkeypatch.setenv("ADMIN_TOOLS_QUOTA_STATE_PATH", str(state_path))
     monkeypatch.setenv("CONFIG_omero_fs_repo_path", "%group%/%user%/%time%")
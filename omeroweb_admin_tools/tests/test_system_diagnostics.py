@@ -11,8 +11,10 @@ def test_run_diagnostic_script_unknown_id() -> None:
     assert "Unknown script_id" in payload["error"]
 
 
-def test_run_diagnostic_script_end_to_end_contains_checks() -> None:
-    payload = run_diagnostic_script("platform_end_to_end")
+def test_run_diagnostic_script_end_to_end_contains_checks(
+    e2e_diagnostic_payload,
+) -> None:
+    payload = e2e_diagnostic_payload
 
     assert payload["script_id"] == "platform_end_to_end"
     assert payload["summary"]["total"] >= 3
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from omeroweb_admin_tools import urls
+from omeroweb_admin_tools.views import index_view
+
+
+@pytest.mark.parametrize(
+    "pattern", urls.urlpatterns, ids=lambda pattern: pattern.name
+)
+def test_lazy_views_resolve_and_mirror_csrf_exemption(pattern) -> None:
+    lazy_view = pattern.callback
+    module_path, attribute = lazy_view.lazy_dotted_path.rsplit(".", 1)
+    module = __import__(module_path, fromlist=[attribute])
+    target_view = getattr(module, attribute)
+
+    assert callable(target_view)
+    assert getattr(lazy_view, "csrf_exempt", False) == getattr(
+        target_view, "csrf_exempt", False
+    )
+
+
+def test_lazy_view_dispatches_to_target(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        index_view,
+        "root_status",
+        lambda request, *args, **kwargs: calls.append((request, kwargs)) or "ok",
+    )
+    lazy_view = urls._lazy("omeroweb_admin_tools.views.index_view.root_status")
+
+    assert lazy_view("request", conn=None) == "ok"
+    assert calls == [("request", {"conn": None})]
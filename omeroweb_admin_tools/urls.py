@@ -1,99 +1,126 @@
 from django.urls import path
+from django.utils.module_loading import import_string
+
+_VIEWS = "omeroweb_admin_tools.views.index_view"
+
+
+def _lazy(dotted_path: str, *, csrf_exempt: bool = False):
+    """Return a view that imports ``dotted_path`` on its first request.
+
+    Keeps the view module and its service imports out of URLConf loading.
+    ``csrf_exempt`` must mirror the target view's decorator because the CSRF
+    middleware inspects the resolved callback before the target is imported.
+    """
+    resolved = None
+
+    def view(request, *args, **kwargs):
+        nonlocal resolved
+        if resolved is None:
+            resolved = import_string(dotted_path)
+        return resolved(request, *args, **kwargs)
+
+    view.__name__ = dotted_path.rsplit(".", 1)[-1]
+    view.__qualname__ = view.__name__
+    view.__module__ = dotted_path.rsplit(".", 1)[0]
+    view.lazy_dotted_path = dotted_path
+    if csrf_exempt:
+        view.csrf_exempt = True
+    return view
 
-from .views.help_view import help_page
-from .views.index_view import (
-    index,
-    internal_log_labels,
-    logs_data,
-    logs_view,
-    grafana_proxy,
-    prometheus_proxy,
-    resource_monitoring_data,
-    resource_monitoring_view,
-    root_status,
-    storage_data,
-    storage_quota_data,
-    storage_quota_import,
-    storage_quota_template,
-    storage_quota_update,
-    storage_view,
-    server_database_testing_view,
-    server_database_testing_run,
-)
 
 urlpatterns = [
-    path("", index, name="omeroweb_admin_tools_index"),
-    path("root-status/", root_status, name="omeroweb_admin_tools_root_status"),
-    path("logs/", logs_view, name="omeroweb_admin_tools_logs"),
-    path("logs/data/", logs_data, name="omeroweb_admin_tools_logs_data"),
+    path("", _lazy(f"{_VIEWS}.index"), name="omeroweb_admin_tools_index"),
+    path(
+        "root-status/",
+        _lazy(f"{_VIEWS}.root_status"),
+        name="omeroweb_admin_tools_root_status",
+    ),
+    path("logs/", _lazy(f"{_VIEWS}.logs_view"), name="omeroweb_admin_tools_logs"),
+    path(
+        "logs/data/",
+        _lazy(f"{_VIEWS}.logs_data"),
+        name="omeroweb_admin_tools_logs_data",
+    ),
     path(
         "logs/internal-labels/",
-        internal_log_labels,
+        _lazy(f"{_VIEWS}.internal_log_labels"),
         name="omeroweb_admin_tools_internal_labels",
     ),
     path(
         "resource-monitoring/",
-        resource_monitoring_view,
+        _lazy(f"{_VIEWS}.resource_monitoring_view"),
         name="omeroweb_admin_tools_resource_monitoring",
     ),
     path(
         "resource-monitoring/data/",
-        resource_monitoring_data,
+        _lazy(f"{_VIEWS}.resource_monitoring_data"),
         name="omeroweb_admin_tools_resource_monitoring_data",
     ),
     path(
         "resource-monitoring/grafana-proxy/",
-        grafana_proxy,
+        _lazy(f"{_VIEWS}.grafana_proxy", csrf_exempt=True),
         {"subpath": ""},
         name="omeroweb_admin_tools_grafana_proxy_root",
     ),
     path(
         "resource-monitoring/grafana-proxy/<path:subpath>",
-        grafana_proxy,
+        _lazy(f"{_VIEWS}.grafana_proxy", csrf_exempt=True),
         name="omeroweb_admin_tools_grafana_proxy",
     ),
     path(
         "resource-monitoring/prometheus-proxy/",
-        prometheus_proxy,
+        _lazy(f"{_VIEWS}.prometheus_proxy", csrf_exempt=True),
         {"subpath": ""},
         name="omeroweb_admin_tools_prometheus_proxy_root",
     ),
     path(
         "resource-monitoring/prometheus-proxy/<path:subpath>",
-        prometheus_proxy,
+        _lazy(f"{_VIEWS}.prometheus_proxy", csrf_exempt=True),
         name="omeroweb_admin_tools_prometheus_proxy",
     ),
-    path("storage/", storage_view, name="omeroweb_admin_tools_storage"),
-    path("storage/data/", storage_data, name="omeroweb_admin_tools_storage_data"),
+    path(
+        "storage/",
+        _lazy(f"{_VIEWS}.storage_view"),
+        name="omeroweb_admin_tools_storage",
+    ),
+    path(
+        "storage/data/",
+        _lazy(f"{_VIEWS}.storage_data"),
+        name="omeroweb_admin_tools_storage_data",
+    ),
     path(
         "storage/quota/data/",
-        storage_quota_data,
+        _lazy(f"{_VIEWS}.storage_quota_data", csrf_exempt=True),
         name="omeroweb_admin_tools_storage_quota_data",
     ),
     path(
         "storage/quota/update/",
-        storage_quota_update,
+        _lazy(f"{_VIEWS}.storage_quota_update", csrf_exempt=True),
         name="omeroweb_admin_tools_storage_quota_update",
     ),
     path(
         "storage/quota/import/",
-        storage_quota_import,
+        _lazy(f"{_VIEWS}.storage_quota_import", csrf_exempt=True),
         name="omeroweb_admin_tools_storage_quota_import",
     ),
     path(
         "storage/quota/template/",
-        storage_quota_template,
+        _lazy(f"{_VIEWS}.storage_quota_template"),
         name="omeroweb_admin_tools_storage_quota_template",
     ),
     path(
         "server-database-testing/",
-        server_database_testing_view,
+        _lazy(f"{_VIEWS}.server_database_testing_view"),
         name="omeroweb_admin_tools_server_database_testing",
     ),
     path(
         "server-database-testing/run/",
-        server_database_testing_run,
+        _lazy(f"{_VIEWS}.server_database_testing_run", csrf_exempt=True),
         name="omeroweb_admin_tools_server_database_testing_run",
     ),
-    path("help/", help_page, name="omeroweb_admin_tools_help"),
+    path(
+        "help/",
+        _lazy("omeroweb_admin_tools.views.help_view.help_page"),
+        name="omeroweb_admin_tools_help",
+    ),
 ]
@@ -1,33 +1,51 @@
+import hashlib
+import heapq
 import json
 import logging
 import os
 import re
 import shutil
 import socket
-import subprocess
+import threading
+import time
 import traceback
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from csv import Error as CsvError
 from html import escape
-from http.cookies import SimpleCookie
+from http.cookies import CookieError
 from http.client import HTTPConnection
 from http.client import HTTPMessage
 from urllib.parse import urlparse
 from urllib.parse import urlencode
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 import urllib.error
 import urllib.request
 import urllib.parse
 
+try:
+    import pwd
+except ImportError:  # pragma: no cover - pwd is POSIX-only
+    pwd = None
+
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.http import HttpResponse
 from django.http import HttpResponseRedirect
+from django.http import StreamingHttpResponse
+from django.http.response import HttpResponseBase
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.views.decorators.csrf import csrf_exempt
+from omero.sys import ParametersI
 from omeroweb.decorators import login_required
 
 from ..config import optional_log_config
@@ -36,6 +54,7 @@ from ..services.log_query import (
     fetch_internal_log_labels,
     serialize_entries,
 )
+from ..services.backend_http import open_backend_url
 from ..services.system_diagnostics import run_diagnostic_script
 from ..services.system_diagnostics import serialize_scripts
 from ..services.storage_quotas import (
@@ -47,10 +66,89 @@ from ..services.storage_quotas import (
     reconcile_quotas,
     upsert_quotas,
 )
-from .utils import current_username, require_root_user
+from .utils import current_username, is_root_user, require_root_user
 
 logger = logging.getLogger(__name__)
 LOG_TABLE_ROW_CAP = 5000
+# Log and storage payloads can carry thousands of rows; drop the default
+# ", "/": " padding.
+COMPACT_JSON_DUMPS_PARAMS = {"separators": (",", ":")}
+QUOTA_CSV_MAX_BYTES = 2 * 1024 * 1024
+PROXY_STREAM_CHUNK_BYTES = 64 * 1024
+# Default Grafana dashboard; container environment is fixed for the process.
+GRAFANA_DASHBOARD_UID = os.environ.get(
+    "ADMIN_TOOLS_GRAFANA_DASHBOARD_UID", "omero-infrastructure"
+).strip()
+GRAFANA_DASHBOARD_SLUG = os.environ.get(
+    "ADMIN_TOOLS_GRAFANA_DASHBOARD_SLUG", "server-infrastructure"
+).strip()
+PROMETHEUS_QUERY_CACHE_TTL_SECONDS = 5.0
+PROMETHEUS_QUERY_CACHE_MAX_ENTRIES = 512
+_PROMETHEUS_QUERY_CACHE: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+_PROMETHEUS_QUERY_CACHE_LOCK = threading.Lock()
+DOCKER_CONTAINER_LIST_TTL_SECONDS = 1.0
+_DOCKER_CONTAINER_LIST_CACHE: Optional[Tuple[float, object]] = None
+_DOCKER_CONTAINER_LIST_LOCK = threading.Lock()
+DOCKER_MAX_IDLE_CONNECTIONS = 8
+DOCKER_INSPECT_MAX_WORKERS = 8
+DIAGNOSTICS_MAX_WORKERS = 8
+# Computed storage payloads are shared through the Django cache (Redis in
+# deployments) so back-to-back refreshes skip the OriginalFile aggregation.
+STORAGE_DATA_CACHE_KEY = "omeroweb_admin_tools:storage_data:v1"
+STORAGE_DATA_CACHE_TTL_SECONDS = 30
+# Storage projection rows are fetched in pages to bound peak memory.
+STORAGE_QUERY_PAGE_SIZE = 10000
+# Bytes per owner/group pair; the order by keeps paging stable.
+_STORAGE_DISTRIBUTION_HQL = """
+    select e.id, e.omeName, g.id, g.name, sum(file.size)
+    from OriginalFile file
+    join file.details.owner e
+    join file.details.group g
+    group by e.id, e.omeName, g.id, g.name
+    order by e.id, g.id
+"""
+# Threads are started lazily, so each web worker process gets its own.
+_BLOCKING_IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="admin-tools-io"
+)
+_COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+# Shared read-only default for missing label/metric maps in per-item loops.
+_EMPTY_MAPPING: Mapping[str, object] = MappingProxyType({})
+_CONTAINER_SUMMARY_KEYS = ("Id", "State", "Status")
+_DOCKER_STATUS_HEALTH_TOKENS = (
+    ("(healthy)", "healthy"),
+    ("(unhealthy)", "unhealthy"),
+    ("(starting)", "starting"),
+)
+_DOCKER_IDLE_CONNECTIONS: List["_UnixSocketHTTPConnection"] = []
+_DOCKER_CONNECTION_LOCK = threading.Lock()
+# Request headers relayed to proxied backends, keyed by lowercased name.
+_FORWARDED_REQUEST_HEADERS = {
+    name.lower(): name
+    for name in (
+        "Accept",
+        "Content-Type",
+        "User-Agent",
+        "Authorization",
+        "Cookie",
+        "Origin",
+        "Referer",
+    )
+}
+# Grafana boot settings; whitespace and value lengths are capped so every
+# rewrite match has a bounded length for chunked HTML rewriting.
+_APP_URL_SETTING_PATTERN = (
+    rb'"(?P<app_setting>appSubUrl|appUrl)"\s{0,32}:\s{0,32}"[^"]{0,2048}"'
+)
+_HTML_REWRITE_MAX_MATCH_BYTES = len(b'"appSubUrl"') + 32 + 1 + 32 + 2048 + 2
+_COMPOSE_SERVICE_RE = re.compile(r"^  ([a-zA-Z0-9_-]+):\s*$")
+# Legacy compose container names: ``<project>_<service>_<index>``.
+_COMPOSE_CONTAINER_RE = re.compile(r"^[^_]+_([^_]+)_\d+$")
+_INTERNAL_HOSTNAMES = frozenset(
+    {"", "localhost", "127.0.0.1", "::1", "grafana", "prometheus"}
+)
+# Printable ASCII, CSV whitespace, and UTF-8 lead/continuation bytes.
+_QUOTA_CSV_ALLOWED_BYTES = bytes(range(0x20, 0x7F)) + b"\r\n\t" + bytes(range(0x80, 0x100))
 
 
 def _to_int_env(name: str, default: int) -> int:
@@ -67,10 +165,13 @@ def _probe_http_url(url: str, timeout_seconds: float = 2.5) -> Dict[str, object]
     """Probe an HTTP endpoint and return availability diagnostics."""
     try:
         request = urllib.request.Request(url, method="GET")
-        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+        with open_backend_url(request, timeout=timeout_seconds) as response:
             status_code = int(getattr(response, "status", 0) or 0)
             return {"ok": 200 <= status_code < 400, "status": status_code, "error": ""}
     except urllib.error.HTTPError as exc:
+        # Drain and close the error body so the pooled socket is reused.
+        with exc:
+            exc.read()
         return {"ok": False, "status": int(exc.code), "error": f"HTTP {exc.code}"}
     except urllib.error.URLError as exc:
         return {"ok": False, "status": 0, "error": str(exc.reason)}
@@ -102,18 +203,10 @@ def _proxy_http_request(
         return JsonResponse({"error": "Invalid URL format"}, status=400)
 
     forwarded_headers = {}
-    for header_name in (
-        "Accept",
-        "Content-Type",
-        "User-Agent",
-        "Authorization",
-        "Cookie",
-        "Origin",
-        "Referer",
-    ):
-        value = django_request.headers.get(header_name)
-        if value:
-            forwarded_headers[header_name] = value
+    for header_name, value in django_request.headers.items():
+        canonical_name = _FORWARDED_REQUEST_HEADERS.get(header_name.lower())
+        if canonical_name and value:
+            forwarded_headers[canonical_name] = value
 
     if rewrite_origin_headers:
         backend_origin = _origin_from_url(base_url)
@@ -134,18 +227,10 @@ def _proxy_http_request(
         method=django_request.method,
     )
     try:
-        with urllib.request.urlopen(request, timeout=10.0) as response:
-            payload = response.read()
-            headers: HTTPMessage = response.headers
-            return _build_proxied_response(
-                payload,
-                status_code=int(response.status),
-                headers=headers,
-                base_url=base_url,
-                proxy_prefix=proxy_prefix,
-            )
+        response = open_backend_url(request, timeout=10.0)
     except urllib.error.HTTPError as exc:
-        body = exc.read()
+        with exc:
+            body = exc.read()
         return _build_proxied_response(
             body,
             status_code=int(exc.code),
@@ -159,6 +244,117 @@ def _proxy_http_request(
             status=502,
         )
 
+    headers: HTTPMessage = response.headers
+    # Relay the backend body chunk by chunk instead of buffering it; HTML is
+    # rewritten on the fly and the generator closes the backend connection.
+    body = _iter_backend_body(response)
+    if _needs_html_rewrite(headers, proxy_prefix):
+        body = _iter_rewritten_html(body, base_url, proxy_prefix)
+    proxied = StreamingHttpResponse(
+        body,
+        status=int(response.status),
+        content_type=_proxied_content_type(headers),
+    )
+    _copy_proxied_headers(headers, proxied, base_url, proxy_prefix)
+    return proxied
+
+
+def _iter_backend_body(response) -> Iterator[bytes]:
+    """Yield a backend response body in fixed-size chunks, then close it."""
+    try:
+        while True:
+            chunk = response.read(PROXY_STREAM_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        response.close()
+
+
+def _proxied_content_type(headers: HTTPMessage) -> str:
+    """Return the backend content type, defaulting to opaque bytes."""
+    return headers.get("Content-Type", "application/octet-stream")
+
+
+def _needs_html_rewrite(headers: HTTPMessage, proxy_prefix: str) -> bool:
+    """Return whether a proxied body needs proxy link rewriting."""
+    return bool(proxy_prefix) and "text/html" in _proxied_content_type(headers)
+
+
+@lru_cache(maxsize=8)
+def _html_rewrite_pattern(base_url: bytes) -> "re.Pattern[bytes]":
+    """Return one alternation regex covering every proxied HTML rewrite.
+
+    Matches Grafana's ``appSubUrl``/``appUrl`` boot settings, root-relative
+    ``href``/``src``/``action`` attributes, the bare ``href="login"`` link,
+    and absolute backend URLs, so a single pass rewrites the payload.
+    """
+    alternatives = [
+        _APP_URL_SETTING_PATTERN,
+        rb"""(?P<attr>href|src|action)=(?P<quote>["'])/""",
+        rb"""href=(?P<login_quote>["'])login(?P=login_quote)""",
+    ]
+    if base_url:
+        alternatives.append(re.escape(base_url))
+    return re.compile(b"|".join(alternatives))
+
+
+def _rewrite_html_match(
+    match: "re.Match[bytes]", proxy_prefix: bytes, escaped_prefix: bytes
+) -> bytes:
+    """Return the proxied replacement for a ``_html_rewrite_pattern`` match."""
+    app_setting = match.group("app_setting")
+    if app_setting == b"appSubUrl":
+        return b'"appSubUrl":"%s"' % escaped_prefix
+    if app_setting:
+        return b'"appUrl":"%s/"' % escaped_prefix
+    if match.group("attr"):
+        return b"%s=%s%s/" % (match.group("attr"), match.group("quote"), proxy_prefix)
+    login_quote = match.group("login_quote")
+    if login_quote:
+        return b"href=%s%s/login%s" % (login_quote, proxy_prefix, login_quote)
+    return proxy_prefix
+
+
+def _iter_rewritten_html(
+    chunks: Iterable[bytes], base_url: str, proxy_prefix: str
+) -> Iterator[bytes]:
+    """Rewrite proxied HTML chunk by chunk without buffering the whole page.
+
+    Every pattern is ASCII, which never appears inside a multi-byte UTF-8
+    sequence, so the rewrite runs on raw bytes and leaves non-UTF-8 pages
+    byte-for-byte intact. Each match is bounded in length, so holding back
+    one match-length of tail between chunks keeps matches from being split.
+    """
+    backend_base_url = base_url.rstrip("/").encode("utf-8")
+    pattern = _html_rewrite_pattern(backend_base_url)
+    prefix_bytes = proxy_prefix.encode("utf-8")
+    escaped_prefix = prefix_bytes.replace(b'"', rb"\"")
+    hold_back = max(_HTML_REWRITE_MAX_MATCH_BYTES, len(backend_base_url)) - 1
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        if len(pending) <= hold_back:
+            continue
+        cut = len(pending) - hold_back
+        output = []
+        position = 0
+        for match in pattern.finditer(pending):
+            if match.start() >= cut:
+                break
+            output.append(pending[position : match.start()])
+            output.append(_rewrite_html_match(match, prefix_bytes, escaped_prefix))
+            position = match.end()
+        cut = max(cut, position)
+        output.append(pending[position:cut])
+        pending = pending[cut:]
+        yield b"".join(output)
+    if pending:
+        yield pattern.sub(
+            lambda match: _rewrite_html_match(match, prefix_bytes, escaped_prefix),
+            pending,
+        )
+
 
 def _build_proxied_response(
     payload: bytes,
@@ -169,55 +365,46 @@ def _build_proxied_response(
     proxy_prefix: str,
 ) -> HttpResponse:
     """Build a Django response from backend payload and headers."""
-    content_type = headers.get("Content-Type", "application/octet-stream")
-    if "text/html" in content_type and proxy_prefix:
-        try:
-            text = payload.decode("utf-8")
-        except UnicodeDecodeError:
-            text = payload.decode("latin-1", errors="ignore")
-        text = text.replace('href="/', f'href="{proxy_prefix}/')
-        text = text.replace("href='/", f"href='{proxy_prefix}/")
-        text = text.replace('src="/', f'src="{proxy_prefix}/')
-        text = text.replace("src='/", f"src='{proxy_prefix}/")
-        text = text.replace('action="/', f'action="{proxy_prefix}/')
-        text = text.replace("action='/", f"action='{proxy_prefix}/")
-        text = text.replace('href="login"', f'href="{proxy_prefix}/login"')
-        text = text.replace("href='login'", f"href='{proxy_prefix}/login'")
-        text = text.replace(base_url.rstrip("/"), proxy_prefix)
-
-        escaped_prefix = proxy_prefix.replace('"', r"\"")
-        escaped_app_url = f"{escaped_prefix}/" if escaped_prefix else "/"
-        text = re.sub(
-            r'"appSubUrl"\s*:\s*"[^"]*"',
-            f'"appSubUrl":"{escaped_prefix}"',
-            text,
-        )
-        text = re.sub(
-            r'"appUrl"\s*:\s*"[^"]*"',
-            f'"appUrl":"{escaped_app_url}"',
-            text,
-        )
-
-        payload = text.encode("utf-8")
+    content_type = _proxied_content_type(headers)
+    if _needs_html_rewrite(headers, proxy_prefix):
+        payload = b"".join(_iter_rewritten_html((payload,), base_url, proxy_prefix))
     proxied = HttpResponse(payload, status=status_code, content_type=content_type)
-    for header_name in ("Cache-Control", "ETag", "Last-Modified"):
-        header_value = headers.get(header_name)
+    _copy_proxied_headers(headers, proxied, base_url, proxy_prefix)
+    return proxied
+
+
+def _copy_proxied_headers(
+    headers: HTTPMessage,
+    proxied: HttpResponseBase,
+    base_url: str,
+    proxy_prefix: str,
+) -> None:
+    """Copy cache, cookie and redirect headers onto a proxied response."""
+    # One pass over the backend headers instead of a linear scan per lookup;
+    # the first occurrence wins, as with HTTPMessage.get().
+    backend_headers: Dict[str, str] = {}
+    for header_name, header_value in headers.items():
+        backend_headers.setdefault(header_name.lower(), header_value)
+    for header_name, header_key in (
+        ("Cache-Control", "cache-control"),
+        ("ETag", "etag"),
+        ("Last-Modified", "last-modified"),
+    ):
+        header_value = backend_headers.get(header_key)
         if header_value:
             proxied[header_name] = header_value
     _copy_set_cookie_headers(headers, proxied, proxy_prefix)
-    location = headers.get("Location")
+    location = backend_headers.get("location")
     if location:
-        if location.startswith(base_url.rstrip("/")):
-            proxied["Location"] = location.replace(
-                base_url.rstrip("/"), proxy_prefix, 1
-            )
+        backend_base_url = base_url.rstrip("/")
+        if location.startswith(backend_base_url):
+            proxied["Location"] = proxy_prefix + location[len(backend_base_url) :]
         elif location.startswith("/") and proxy_prefix:
             proxied["Location"] = f"{proxy_prefix}{location}"
         elif not urlparse(location).scheme and proxy_prefix:
             proxied["Location"] = f"{proxy_prefix}/{location.lstrip('/')}"
         else:
             proxied["Location"] = location
-    return proxied
 
 
 def _cookie_path_for_proxy(original_path: str, proxy_prefix: str) -> str:
@@ -250,28 +437,48 @@ def _copy_set_cookie_headers(
     """Copy backend Set-Cookie headers and rewrite path for proxied requests."""
     raw_set_cookie_headers = backend_headers.get_all("Set-Cookie", [])
     for raw_cookie in raw_set_cookie_headers:
-        parsed_cookie = SimpleCookie()
-        parsed_cookie.load(raw_cookie)
-        for morsel in parsed_cookie.values():
-            max_age: Optional[int] = None
-            if morsel["max-age"]:
-                try:
-                    max_age = int(morsel["max-age"])
-                except ValueError:
-                    logger.warning(
-                        "Skipping invalid cookie max-age: %s", morsel["max-age"]
-                    )
+        # Set-Cookie carries exactly one cookie, so a plain split is enough
+        # and avoids building a SimpleCookie jar per header.
+        cookie_pair, _, raw_attributes = raw_cookie.partition(";")
+        name, separator, value = cookie_pair.partition("=")
+        name = name.strip()
+        if not name or not separator:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        attributes: Dict[str, str] = {}
+        for raw_attribute in raw_attributes.split(";"):
+            attribute_name, _, attribute_value = raw_attribute.partition("=")
+            attributes[attribute_name.strip().lower()] = attribute_value.strip()
+
+        max_age: Optional[int] = None
+        if attributes.get("max-age"):
+            try:
+                max_age = int(attributes["max-age"])
+            except ValueError:
+                logger.warning(
+                    "Skipping invalid cookie max-age: %s", attributes["max-age"]
+                )
+        try:
             response.set_cookie(
-                morsel.key,
-                morsel.value,
+                name,
+                value,
                 max_age=max_age,
-                expires=morsel["expires"] or None,
-                path=_cookie_path_for_proxy(morsel["path"] or "/", proxy_prefix),
-                domain=morsel["domain"] or None,
-                secure=bool(morsel["secure"]),
-                httponly=bool(morsel["httponly"]),
-                samesite=morsel["samesite"] or None,
+                expires=attributes.get("expires") or None,
+                path=_cookie_path_for_proxy(
+                    attributes.get("path") or "/", proxy_prefix
+                ),
+                domain=attributes.get("domain") or None,
+                secure="secure" in attributes,
+                httponly="httponly" in attributes,
+                samesite=attributes.get("samesite") or None,
             )
+        except (CookieError, ValueError) as exc:
+            # A malformed backend cookie must not fail the proxied page.
+            # set_cookie validates SameSite after storing the morsel.
+            response.cookies.pop(name, None)
+            logger.warning("Skipping invalid backend cookie %r: %s", name, exc)
 
 
 def _build_proxy_backend_urls(internal_url: str, public_url: str) -> List[str]:
@@ -281,25 +488,19 @@ def _build_proxy_backend_urls(internal_url: str, public_url: str) -> List[str]:
     a fallback, which allows deployments where internal service DNS is
     unavailable from the OMERO.web container.
     """
-    urls: List[str] = []
-    for candidate in (internal_url, public_url):
-        normalized = str(candidate or "").strip().rstrip("/")
-        if not normalized or normalized in urls:
-            continue
-        urls.append(normalized)
-    return urls
+    normalized_urls = (
+        str(candidate or "").strip().rstrip("/")
+        for candidate in (internal_url, public_url)
+    )
+    return list(dict.fromkeys(url for url in normalized_urls if url))
 
 
 def _grafana_proxy_home_fallback_response(proxy_prefix: str) -> HttpResponse:
     """Redirect Grafana root requests to the configured default dashboard."""
     normalized_prefix = str(proxy_prefix or "").rstrip("/")
-    dashboard_uid = os.environ.get(
-        "ADMIN_TOOLS_GRAFANA_DASHBOARD_UID", "omero-infrastructure"
-    ).strip()
-    dashboard_slug = os.environ.get(
-        "ADMIN_TOOLS_GRAFANA_DASHBOARD_SLUG", "server-infrastructure"
-    ).strip()
-    dashboard_path = f"{normalized_prefix}/d/{dashboard_uid}/{dashboard_slug}"
+    dashboard_path = (
+        f"{normalized_prefix}/d/{GRAFANA_DASHBOARD_UID}/{GRAFANA_DASHBOARD_SLUG}"
+    )
 
     return HttpResponseRedirect(dashboard_path)
 
@@ -380,8 +581,9 @@ def _grafana_unavailable_response(
 
 def _is_internal_hostname(hostname: str) -> bool:
     """Return whether hostname points to a local/container-only endpoint."""
-    lowered = str(hostname or "").strip().lower()
-    return lowered in {"", "localhost", "127.0.0.1", "::1", "grafana", "prometheus"}
+    if hostname in _INTERNAL_HOSTNAMES:
+        return True
+    return str(hostname or "").strip().lower() in _INTERNAL_HOSTNAMES
 
 
 def _is_behind_reverse_proxy(request) -> bool:
@@ -449,49 +651,46 @@ def _unwrap_rtype_value(value, default=None):
     """Extract primitive values from OMERO rtypes and similar wrappers."""
     if value is None:
         return default
-    if hasattr(value, "val"):
+    try:
         return value.val
-    if hasattr(value, "getValue"):
-        return value.getValue()
+    except AttributeError:
+        pass
+    get_value = getattr(value, "getValue", None)
+    if get_value is not None:
+        return get_value()
     return value
 
 
+def _read_model_value(obj, getter_name: str, field_name: str, default=""):
+    """Read an OMERO model value via its getter, falling back to the raw field.
+
+    The getter is the common case for experimenter and group wrappers, so it
+    is tried directly instead of probing with ``hasattr`` first.
+    """
+    try:
+        getter = getattr(obj, getter_name)
+    except AttributeError:
+        return _unwrap_rtype_value(getattr(obj, field_name, None), default)
+    return _unwrap_rtype_value(getter(), default)
+
+
 def _safe_full_name(user_obj) -> str:
     """Return "First Last" for an OMERO experimenter-like object."""
-    first_name = ""
-    last_name = ""
-    for getter_name, field_name in (
-        ("getFirstName", "firstName"),
-        ("getLastName", "lastName"),
-    ):
-        raw_value = None
-        if hasattr(user_obj, getter_name):
-            raw_value = _unwrap_rtype_value(getattr(user_obj, getter_name)(), "")
-        elif hasattr(user_obj, field_name):
-            raw_value = _unwrap_rtype_value(getattr(user_obj, field_name), "")
-        if getter_name == "getFirstName":
-            first_name = str(raw_value or "").strip()
-        else:
-            last_name = str(raw_value or "").strip()
-    return " ".join(part for part in (first_name, last_name) if part)
+    first_name = str(_read_model_value(user_obj, "getFirstName", "firstName") or "")
+    last_name = str(_read_model_value(user_obj, "getLastName", "lastName") or "")
+    return " ".join(
+        part for part in (first_name.strip(), last_name.strip()) if part
+    )
 
 
 def _safe_username(user_obj) -> str:
     """Return username for an OMERO experimenter-like object."""
-    if hasattr(user_obj, "getOmeName"):
-        return str(_unwrap_rtype_value(user_obj.getOmeName(), "") or "").strip()
-    if hasattr(user_obj, "omeName"):
-        return str(_unwrap_rtype_value(user_obj.omeName, "") or "").strip()
-    return ""
+    return str(_read_model_value(user_obj, "getOmeName", "omeName") or "").strip()
 
 
 def _safe_group_name(group_obj) -> str:
     """Return name for an OMERO group-like object."""
-    if hasattr(group_obj, "getName"):
-        return str(_unwrap_rtype_value(group_obj.getName(), "") or "").strip()
-    if hasattr(group_obj, "name"):
-        return str(_unwrap_rtype_value(group_obj.name, "") or "").strip()
-    return ""
+    return str(_read_model_value(group_obj, "getName", "name") or "").strip()
 
 
 def _call_admin_listing(admin_service, method_name, arg_options=None):
@@ -513,12 +712,7 @@ def _safe_object_id(obj):
     """Extract numeric ID for OMERO model-like objects."""
     if obj is None:
         return None
-    if hasattr(obj, "getId"):
-        value = _unwrap_rtype_value(obj.getId(), None)
-    elif hasattr(obj, "id"):
-        value = _unwrap_rtype_value(obj.id, None)
-    else:
-        value = None
+    value = _read_model_value(obj, "getId", "id", None)
     try:
         return int(value) if value is not None else None
     except (TypeError, ValueError):
@@ -562,23 +756,33 @@ def _list_all_users_and_groups(conn):
             if experimenter_groups:
                 break
 
+        # Resolve each listed object once and key the results by OMERO id so
+        # the membership passes below can skip the reflective name lookups.
+        user_entries = []
+        usernames_by_id = {}
         for user in experimenters:
             username = _safe_username(user)
             if username:
                 users[username] = _safe_full_name(user)
                 groups_by_user.setdefault(username, set())
+                user_id = _safe_object_id(user)
+                if user_id is not None:
+                    user_entries.append((user_id, username))
+                    usernames_by_id[user_id] = username
+        group_entries = []
+        group_names_by_id = {}
         for group in experimenter_groups:
             group_name = _safe_group_name(group)
             if group_name:
                 groups.add(group_name)
                 group_permissions[group_name] = _safe_group_permission_label(group)
                 users_by_group.setdefault(group_name, set())
+                group_id = _safe_object_id(group)
+                if group_id is not None:
+                    group_entries.append((group_id, group_name))
+                    group_names_by_id[group_id] = group_name
 
-        for user in experimenters:
-            user_id = _safe_object_id(user)
-            username = _safe_username(user)
-            if user_id is None or not username:
-                continue
+        for user_id, username in user_entries:
             user_groups = _call_admin_listing(
                 admin_service,
                 "containedGroups",
@@ -590,21 +794,20 @@ def _list_all_users_and_groups(conn):
                 ),
             )
             for group in user_groups:
-                group_name = _safe_group_name(group)
+                group_name = group_names_by_id.get(
+                    _safe_object_id(group)
+                ) or _safe_group_name(group)
                 if not group_name:
                     continue
                 groups.add(group_name)
                 groups_by_user.setdefault(username, set()).add(group_name)
                 users_by_group.setdefault(group_name, set()).add(username)
-                group_permissions.setdefault(
-                    group_name, _safe_group_permission_label(group)
-                )
+                if group_name not in group_permissions:
+                    group_permissions[group_name] = _safe_group_permission_label(
+                        group
+                    )
 
-        for group in experimenter_groups:
-            group_id = _safe_object_id(group)
-            group_name = _safe_group_name(group)
-            if group_id is None or not group_name:
-                continue
+        for group_id, group_name in group_entries:
             group_users = _call_admin_listing(
                 admin_service,
                 "containedExperimenters",
@@ -616,10 +819,13 @@ def _list_all_users_and_groups(conn):
                 ),
             )
             for user in group_users:
-                username = _safe_username(user)
+                username = usernames_by_id.get(
+                    _safe_object_id(user)
+                ) or _safe_username(user)
                 if not username:
                     continue
-                users.setdefault(username, _safe_full_name(user))
+                if username not in users:
+                    users[username] = _safe_full_name(user)
                 groups_by_user.setdefault(username, set()).add(group_name)
                 users_by_group.setdefault(group_name, set()).add(username)
     except Exception:
@@ -673,15 +879,6 @@ def _safe_group_permission_label(group_obj) -> str:
     return "Private"
 
 
-def _require_root_user(request, conn):
-    username = current_username(request, conn)
-    if username != "root":
-        return JsonResponse(
-            {"error": "Only root user can access admin tools data."}, status=403
-        )
-    return None
-
-
 @login_required()
 def index(request, conn=None, url=None, **kwargs):
     """Render the Admin tools landing page."""
@@ -743,9 +940,6 @@ def logs_view(request, conn=None, url=None, **kwargs):
 @require_root_user
 def logs_data(request, conn=None, url=None, **kwargs):
     """Serve log entries as JSON from the Loki backend."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
     log_config = optional_log_config()
     if log_config is None:
         return JsonResponse(
@@ -787,34 +981,38 @@ def logs_data(request, conn=None, url=None, **kwargs):
             {"error": f"Failed to fetch logs: {exc}"},
             status=502,
         )
-    if level:
-        entries = [entry for entry in entries if entry.level == level]
-    if query:
+    if level or query:
         needle = query.lower()
+        # Needles without cased characters (request IDs, IPs, status codes)
+        # match the same either way, so skip lowercasing every message.
+        fold = str.lower if needle.islower() else str
         entries = [
             entry
             for entry in entries
-            if needle in entry.message.lower()
-            or needle in entry.container.lower()
-            or needle in entry.level.lower()
+            if (not level or entry.level == level)
+            and (
+                not needle
+                or needle in fold(entry.message)
+                or needle in fold(entry.container)
+                or needle in fold(entry.level)
+            )
         ]
-    return JsonResponse({"entries": serialize_entries(entries)})
+    return JsonResponse(
+        {"entries": serialize_entries(entries)},
+        json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
+    )
 
 
 @login_required()
 def root_status(request, conn=None, url=None, **kwargs):
     """Return whether the current user is root."""
-    username = current_username(request, conn)
-    return JsonResponse({"is_root_user": username == "root"})
+    return JsonResponse({"is_root_user": is_root_user(request, conn)})
 
 
 @login_required()
 @require_root_user
 def internal_log_labels(request, conn=None, url=None, **kwargs):
     """Return available filenames for an internal log compose_service."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
     log_config = optional_log_config()
     if log_config is None:
         return JsonResponse(
@@ -838,13 +1036,21 @@ def internal_log_labels(request, conn=None, url=None, **kwargs):
 def _load_compose_service_names(compose_file: str = "docker-compose.yml") -> List[str]:
     """Return declared Docker Compose service names from the local compose file."""
     compose_path = os.path.join(os.getcwd(), compose_file)
-    if not os.path.exists(compose_path):
+    try:
+        compose_mtime_ns = os.stat(compose_path).st_mtime_ns
+    except OSError:
         logger.warning("Compose file not found at %s", compose_path)
         return []
+    return list(_parse_compose_service_names(compose_path, compose_mtime_ns))
 
+
+@lru_cache(maxsize=4)
+def _parse_compose_service_names(
+    compose_path: str, compose_mtime_ns: int
+) -> Tuple[str, ...]:
+    """Scan a compose file for service names; the mtime key busts the cache."""
     service_names: List[str] = []
     in_services = False
-    service_pattern = re.compile(r"^  ([a-zA-Z0-9_-]+):\s*$")
 
     with open(compose_path, "r", encoding="utf-8") as handle:
         for raw_line in handle:
@@ -856,19 +1062,57 @@ def _load_compose_service_names(compose_file: str = "docker-compose.yml") -> Lis
                 break
             if not in_services:
                 continue
-            match = service_pattern.match(line)
+            match = _COMPOSE_SERVICE_RE.match(line)
             if match:
                 service_names.append(match.group(1))
 
-    return service_names
+    return tuple(service_names)
 
 
-def _prometheus_instant_query(prometheus_base_url: str, expr: str) -> Optional[float]:
-    """Execute a Prometheus instant query and return the first numeric value."""
+def _prometheus_query_payload(prometheus_base_url: str, expr: str) -> Dict:
+    """Return the decoded Prometheus instant-query payload, cached briefly.
+
+    Admin pages issue the same handful of expressions on every load while
+    the underlying series move on multi-minute rate windows, so answers are
+    reused for ``PROMETHEUS_QUERY_CACHE_TTL_SECONDS``. Failures are not cached.
+    """
+    cache_key = (prometheus_base_url, expr)
+    now = time.monotonic()
+    with _PROMETHEUS_QUERY_CACHE_LOCK:
+        cached = _PROMETHEUS_QUERY_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     query = urlencode({"query": expr})
     query_url = f"{prometheus_base_url.rstrip('/')}/api/v1/query?{query}"
-    with urllib.request.urlopen(query_url, timeout=5.0) as response:
-        payload = json.loads(response.read().decode("utf-8"))
+    try:
+        with open_backend_url(query_url, timeout=5.0) as response:
+            payload = json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        exc.close()
+        raise
+
+    with _PROMETHEUS_QUERY_CACHE_LOCK:
+        if len(_PROMETHEUS_QUERY_CACHE) >= PROMETHEUS_QUERY_CACHE_MAX_ENTRIES:
+            expired = [
+                key
+                for key, (expires_at, _payload) in _PROMETHEUS_QUERY_CACHE.items()
+                if expires_at <= now
+            ]
+            for key in expired:
+                del _PROMETHEUS_QUERY_CACHE[key]
+            if len(_PROMETHEUS_QUERY_CACHE) >= PROMETHEUS_QUERY_CACHE_MAX_ENTRIES:
+                _PROMETHEUS_QUERY_CACHE.pop(next(iter(_PROMETHEUS_QUERY_CACHE)))
+        _PROMETHEUS_QUERY_CACHE[cache_key] = (
+            now + PROMETHEUS_QUERY_CACHE_TTL_SECONDS,
+            payload,
+        )
+    return payload
+
+
+def _prometheus_instant_query(prometheus_base_url: str, expr: str) -> Optional[float]:
+    """Execute a Prometheus instant query and return the first numeric value."""
+    payload = _prometheus_query_payload(prometheus_base_url, expr)
     results = payload.get("data", {}).get("result", [])
     if not results:
         return None
@@ -894,11 +1138,19 @@ def _collect_system_metrics(prometheus_base_url: str) -> Dict[str, Optional[floa
         "network_receive_bps": 'sum(rate(node_network_receive_bytes_total{device!="lo"}[5m]))',
         "network_transmit_bps": 'sum(rate(node_network_transmit_bytes_total{device!="lo"}[5m]))',
     }
-    for metric_name, expr in expressions.items():
-        try:
-            metrics[metric_name] = _prometheus_instant_query(prometheus_base_url, expr)
-        except Exception:
-            logger.exception("Failed to fetch Prometheus metric %s", metric_name)
+    # The queries are independent and I/O-bound; run them concurrently so the
+    # cold path costs one Prometheus round trip instead of one per metric.
+    with ThreadPoolExecutor(max_workers=len(expressions)) as executor:
+        futures = {
+            executor.submit(_prometheus_instant_query, prometheus_base_url, expr): name
+            for name, expr in expressions.items()
+        }
+        for future in as_completed(futures):
+            metric_name = futures[future]
+            try:
+                metrics[metric_name] = future.result()
+            except Exception:
+                logger.exception("Failed to fetch Prometheus metric %s", metric_name)
     return metrics
 
 
@@ -909,10 +1161,7 @@ def _collect_recently_seen_services(prometheus_base_url: str) -> List[str]:
         "(max_over_time(container_last_seen"
         '{container_label_com_docker_compose_service!="",image!=""}[5m]))'
     )
-    query = urlencode({"query": expr})
-    query_url = f"{prometheus_base_url.rstrip('/')}/api/v1/query?{query}"
-    with urllib.request.urlopen(query_url, timeout=5.0) as response:
-        payload = json.loads(response.read().decode("utf-8"))
+    payload = _prometheus_query_payload(prometheus_base_url, expr)
 
     if payload.get("status") != "success":
         return []
@@ -920,7 +1169,7 @@ def _collect_recently_seen_services(prometheus_base_url: str) -> List[str]:
     results = payload.get("data", {}).get("result", [])
     discovered = set()
     for sample in results:
-        metric = sample.get("metric", {}) or {}
+        metric = sample.get("metric") or _EMPTY_MAPPING
         service_name = str(
             metric.get("container_label_com_docker_compose_service", "")
         ).strip()
@@ -929,28 +1178,6 @@ def _collect_recently_seen_services(prometheus_base_url: str) -> List[str]:
     return sorted(discovered)
 
 
-def _docker_compose_json(command: List[str]) -> Optional[object]:
-    """Run a docker compose JSON command and return decoded payload."""
-    try:
-        process = subprocess.run(
-            command,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        return None
-
-    stdout = process.stdout.strip()
-    if not stdout:
-        return None
-    try:
-        return json.loads(stdout)
-    except json.JSONDecodeError:
-        logger.warning("Failed to decode JSON from command: %s", " ".join(command))
-        return None
-
-
 class _UnixSocketHTTPConnection(HTTPConnection):
     """HTTP client connection implementation for Docker Unix sockets."""
 
@@ -971,18 +1198,24 @@ def _docker_api_json(path: str, timeout_seconds: float = 3.0) -> Optional[object
         logger.debug("Docker socket not found at %s", docker_socket)
         return None
 
-    connection = _UnixSocketHTTPConnection(docker_socket, timeout=timeout_seconds)
+    connection, reused = _checkout_docker_connection(docker_socket, timeout_seconds)
+    reusable = False
     try:
-        connection.request("GET", path)
-        response = connection.getresponse()
-        if response.status < 200 or response.status >= 300:
-            logger.debug(
-                "Docker API request failed for %s with status %d", path, response.status
-            )
+        try:
+            status, payload = _docker_api_get(connection, path)
+        except ConnectionError:
+            if not reused:
+                raise
+            # The daemon closed the idle keep-alive socket; reconnect once.
+            connection.close()
+            status, payload = _docker_api_get(connection, path)
+        reusable = True
+        if status < 200 or status >= 300:
+            logger.debug("Docker API request failed for %s with status %d", path, status)
             return None
-        payload = response.read().decode("utf-8")
         if not payload:
             return None
+        # json.loads detects UTF-8 in bytes itself; skip the intermediate str.
         return json.loads(payload)
     except PermissionError:
         logger.warning(
@@ -997,7 +1230,97 @@ def _docker_api_json(path: str, timeout_seconds: float = 3.0) -> Optional[object
         logger.warning("Docker API request failed for %s: %s", path, exc)
         return None
     finally:
-        connection.close()
+        _checkin_docker_connection(connection, reusable)
+
+
+def _docker_api_get(connection: HTTPConnection, path: str) -> Tuple[int, bytes]:
+    """Send a Docker API GET and read the full body so the socket stays usable."""
+    connection.request("GET", path)
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def _checkout_docker_connection(
+    docker_socket: str, timeout_seconds: float
+) -> Tuple["_UnixSocketHTTPConnection", bool]:
+    """Return an idle keep-alive Docker connection, or a new one.
+
+    The boolean reports whether the connection was reused, in which case the
+    daemon may already have closed it and the caller retries once.
+    """
+    with _DOCKER_CONNECTION_LOCK:
+        while _DOCKER_IDLE_CONNECTIONS:
+            connection = _DOCKER_IDLE_CONNECTIONS.pop()
+            if connection.unix_socket_path == docker_socket:
+                connection.timeout = timeout_seconds
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout_seconds)
+                return connection, True
+            connection.close()
+    return _UnixSocketHTTPConnection(docker_socket, timeout=timeout_seconds), False
+
+
+def _checkin_docker_connection(
+    connection: "_UnixSocketHTTPConnection", reusable: bool
+) -> None:
+    """Keep a healthy connection for the next Docker API call, else close it."""
+    if reusable and connection.sock is not None:
+        with _DOCKER_CONNECTION_LOCK:
+            if len(_DOCKER_IDLE_CONNECTIONS) < DOCKER_MAX_IDLE_CONNECTIONS:
+                _DOCKER_IDLE_CONNECTIONS.append(connection)
+                return
+    connection.close()
+
+
+def _docker_container_list() -> Optional[object]:
+    """Return the Docker ``/containers/json?all=1`` payload, reused briefly.
+
+    The monitoring endpoint reads the container list for both compose health
+    and Docker diagnostics; sharing one fetch for a second avoids another
+    socket round trip and JSON decode per dashboard poll. Failed fetches are
+    not cached. Each entry is reduced to the fields those callers read, so
+    the cached list does not pin mounts, ports and network settings.
+    """
+    global _DOCKER_CONTAINER_LIST_CACHE
+    now = time.monotonic()
+    with _DOCKER_CONTAINER_LIST_LOCK:
+        cached = _DOCKER_CONTAINER_LIST_CACHE
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        containers = _docker_api_json("/containers/json?all=1")
+        if isinstance(containers, list):
+            containers = [_container_summary(container) for container in containers]
+        if containers is not None:
+            _DOCKER_CONTAINER_LIST_CACHE = (
+                now + DOCKER_CONTAINER_LIST_TTL_SECONDS,
+                containers,
+            )
+        return containers
+
+
+def _container_summary(container: object) -> object:
+    """Keep only the container list fields used by health and diagnostics."""
+    if not isinstance(container, dict):
+        return container
+    summary = {
+        key: container[key] for key in _CONTAINER_SUMMARY_KEYS if key in container
+    }
+    labels = container.get("Labels")
+    if isinstance(labels, dict):
+        summary["Labels"] = (
+            {_COMPOSE_SERVICE_LABEL: labels[_COMPOSE_SERVICE_LABEL]}
+            if _COMPOSE_SERVICE_LABEL in labels
+            else {}
+        )
+    elif "Labels" in container:
+        summary["Labels"] = labels
+    return summary
+
+
+def _docker_diagnostics_enabled() -> bool:
+    """Return whether full Docker diagnostics are requested via the environment."""
+    raw_value = os.environ.get("ADMIN_TOOLS_DOCKER_DIAGNOSTICS", "").strip().lower()
+    return raw_value in {"1", "true", "yes", "on"}
 
 
 def _diagnose_docker_health() -> Dict[str, object]:
@@ -1005,8 +1328,12 @@ def _diagnose_docker_health() -> Dict[str, object]:
 
     This is included in the resource monitoring API response to help debug
     cases where container health status is not being reported correctly.
+    Process identity and socket ownership are only collected when the API is
+    unreachable, and container status samples only when
+    ``ADMIN_TOOLS_DOCKER_DIAGNOSTICS`` is enabled, so healthy polls stay cheap.
     """
     docker_socket = os.environ.get("ADMIN_TOOLS_DOCKER_SOCKET", "/var/run/docker.sock")
+    detailed = _docker_diagnostics_enabled()
     diag: Dict[str, object] = {
         "socket_path": docker_socket,
         "socket_exists": os.path.exists(docker_socket),
@@ -1023,39 +1350,12 @@ def _diagnose_docker_health() -> Dict[str, object]:
         "container_count": 0,
         "containers_with_health": 0,
         "sample_statuses": [],
+        "detailed": detailed,
     }
 
-    # Who we are inside the container
-    try:
-        diag["current_uid"] = os.getuid()
-        diag["current_gids"] = list(os.getgroups())
-        import pwd
-
-        try:
-            diag["current_user"] = pwd.getpwuid(os.getuid()).pw_name
-        except KeyError:
-            diag["current_user"] = f"uid={os.getuid()}"
-    except Exception as exc:
-        diag["current_user"] = f"error: {exc}"
-
-    # Socket file ownership
-    if diag["socket_exists"]:
-        try:
-            stat_info = os.stat(docker_socket)
-            diag["socket_stat"] = (
-                f"uid={stat_info.st_uid} gid={stat_info.st_gid} "
-                f"mode={oct(stat_info.st_mode)}"
-            )
-            diag["socket_gid"] = int(stat_info.st_gid)
-            diag["process_in_socket_group"] = int(stat_info.st_gid) in {
-                int(gid) for gid in list(diag.get("current_gids", []))
-            }
-        except Exception as exc:
-            diag["socket_stat"] = f"stat error: {exc}"
-
     # Try the actual API call
     try:
-        containers = _docker_api_json("/containers/json?all=1")
+        containers = _docker_container_list()
         if containers is None:
             diag["api_error"] = "API returned None (connection or permission error)"
         elif not isinstance(containers, list):
@@ -1068,13 +1368,15 @@ def _diagnose_docker_health() -> Dict[str, object]:
             for container in containers[:15]:
                 if not isinstance(container, dict):
                     continue
-                labels = container.get("Labels", {}) or {}
-                service = str(labels.get("com.docker.compose.service", "")).strip()
                 status = str(container.get("Status", "")).strip()
-                state = str(container.get("State", "")).strip()
                 parsed_health = _parse_docker_status_health(status)
                 if parsed_health:
                     health_count += 1
+                if not detailed:
+                    continue
+                labels = container.get("Labels") or _EMPTY_MAPPING
+                service = str(labels.get(_COMPOSE_SERVICE_LABEL, "")).strip()
+                state = str(container.get("State", "")).strip()
                 samples.append(
                     {
                         "service": service or "(no label)",
@@ -1088,19 +1390,51 @@ def _diagnose_docker_health() -> Dict[str, object]:
     except Exception as exc:
         diag["api_error"] = f"{type(exc).__name__}: {exc}"
 
+    if diag["api_reachable"] and not detailed:
+        return diag
+
+    # Who we are inside the container
+    try:
+        diag["current_uid"] = os.getuid()
+        diag["current_gids"] = list(os.getgroups())
+        diag["current_user"] = f"uid={os.getuid()}"
+        if pwd is not None:
+            try:
+                diag["current_user"] = pwd.getpwuid(os.getuid()).pw_name
+            except KeyError:
+                pass
+    except Exception as exc:
+        diag["current_user"] = f"error: {exc}"
+
+    # Socket file ownership
+    if diag["socket_exists"]:
+        try:
+            stat_info = os.stat(docker_socket)
+            diag["socket_stat"] = (
+                f"uid={stat_info.st_uid} gid={stat_info.st_gid} "
+                f"mode={oct(stat_info.st_mode)}"
+            )
+            diag["socket_gid"] = int(stat_info.st_gid)
+            diag["process_in_socket_group"] = int(stat_info.st_gid) in {
+                int(gid) for gid in list(diag.get("current_gids", []))
+            }
+        except Exception as exc:
+            diag["socket_stat"] = f"stat error: {exc}"
+
     return diag
 
 
 def _parse_docker_status_health(status: str) -> str:
     """Parse Docker status text and return health state when present."""
-    match = re.search(r"\((healthy|unhealthy|starting)\)", str(status or "").lower())
-    if match:
-        return match.group(1)
+    text = str(status or "").lower()
+    for token, health in _DOCKER_STATUS_HEALTH_TOKENS:
+        if token in text:
+            return health
     return ""
 
 
 def _load_compose_health_data() -> Tuple[Dict[str, bool], Dict[str, Dict[str, str]]]:
-    """Return compose healthcheck config and runtime state, preferring Docker API.
+    """Return compose healthcheck config and runtime state from the Docker API.
 
     Uses the /containers/json list endpoint directly.  The human-readable
     ``Status`` field already contains healthcheck indicators such as
@@ -1109,13 +1443,12 @@ def _load_compose_health_data() -> Tuple[Dict[str, bool], Dict[str, Dict[str, st
     containers whose Status string does *not* contain a health parenthetical
     (to detect healthchecks that haven't produced a result yet).
     """
-    containers = _docker_api_json("/containers/json?all=1")
+    containers = _docker_container_list()
     if not isinstance(containers, list):
         logger.warning(
-            "Docker API container list unavailable; "
-            "falling back to CLI for compose health data"
+            "Docker API container list unavailable; compose health data skipped"
         )
-        return _load_compose_healthcheck_config(), _load_compose_runtime_health()
+        return {}, {}
 
     healthcheck_config: Dict[str, bool] = {}
     runtime_health: Dict[str, Dict[str, str]] = {}
@@ -1125,19 +1458,24 @@ def _load_compose_health_data() -> Tuple[Dict[str, bool], Dict[str, Dict[str, st
     # that haven't produced a result yet (e.g. still in start_period).
     needs_inspect: List[Tuple[str, str]] = []  # (service_name, container_id)
 
+    parse_status_health = _parse_docker_status_health
     for container in containers:
         if not isinstance(container, dict):
             continue
-        labels = container.get("Labels", {}) or {}
-        if not isinstance(labels, dict):
+        labels = container.get("Labels")
+        if not labels or not isinstance(labels, dict):
             continue
-        service_name = str(labels.get("com.docker.compose.service", "")).strip()
+        service_name = labels.get(_COMPOSE_SERVICE_LABEL)
+        if not service_name:
+            continue
+        service_name = str(service_name).strip()
         if not service_name:
             continue
 
-        state = str(container.get("State", "")).strip().lower()
-        status_text = str(container.get("Status", "")).strip()
-        health_from_status = _parse_docker_status_health(status_text)
+        get = container.get
+        state = str(get("State", "")).strip().lower()
+        # The marker scan ignores surrounding whitespace, so no strip is needed.
+        health_from_status = parse_status_health(get("Status"))
 
         if health_from_status:
             # Status field has a health indicator → container has a healthcheck.
@@ -1150,18 +1488,30 @@ def _load_compose_health_data() -> Tuple[Dict[str, bool], Dict[str, Dict[str, st
             # No health indicator in Status.  Store what we know so far and
             # queue an inspect for running containers (they might have a
             # healthcheck in start_period or without a status yet).
-            if service_name not in healthcheck_config:
-                healthcheck_config[service_name] = False
+            healthcheck_config.setdefault(service_name, False)
             runtime_health[service_name] = {"state": state, "health": ""}
             if state == "running":
-                container_id = str(container.get("Id", "")).strip()
+                container_id = str(get("Id", "")).strip()
                 if container_id:
                     needs_inspect.append((service_name, container_id))
 
     # Inspect only the small set of running containers that lacked a health
-    # parenthetical — typically services without a healthcheck at all.
-    for service_name, container_id in needs_inspect:
-        inspect_payload = _docker_api_json(f"/containers/{container_id}/json")
+    # parenthetical — typically services without a healthcheck at all.  The
+    # inspects are independent socket round-trips, so they run concurrently
+    # and their results are applied in order.
+    inspect_payloads: List[Optional[object]] = []
+    if needs_inspect:
+        with ThreadPoolExecutor(
+            max_workers=min(DOCKER_INSPECT_MAX_WORKERS, len(needs_inspect))
+        ) as executor:
+            inspect_payloads = list(
+                executor.map(
+                    lambda item: _docker_api_json(f"/containers/{item[1]}/json"),
+                    needs_inspect,
+                )
+            )
+
+    for (service_name, _), inspect_payload in zip(needs_inspect, inspect_payloads):
         if not isinstance(inspect_payload, dict):
             continue
 
@@ -1185,41 +1535,30 @@ def _load_compose_health_data() -> Tuple[Dict[str, bool], Dict[str, Dict[str, st
     return healthcheck_config, runtime_health
 
 
-def _load_compose_healthcheck_config() -> Dict[str, bool]:
-    """Return whether each compose service defines a Docker healthcheck."""
-    payload = _docker_compose_json(["docker", "compose", "config", "--format", "json"])
-    if not isinstance(payload, dict):
-        return {}
-    services = payload.get("services", {}) or {}
-    if not isinstance(services, dict):
-        return {}
+def _match_expected_service(candidate: str, expected_lookup: Dict[str, str]) -> str:
+    """Return the expected service a target label refers to, or ``""``.
 
-    result: Dict[str, bool] = {}
-    for service_name, config in services.items():
-        if not isinstance(config, dict):
-            continue
-        result[str(service_name)] = "healthcheck" in config
-    return result
-
-
-def _load_compose_runtime_health() -> Dict[str, Dict[str, str]]:
-    """Return runtime state and health values reported by docker compose ps."""
-    payload = _docker_compose_json(["docker", "compose", "ps", "--format", "json"])
-    if not isinstance(payload, list):
-        return {}
-
-    runtime: Dict[str, Dict[str, str]] = {}
-    for container in payload:
-        if not isinstance(container, dict):
-            continue
-        service_name = str(container.get("Service", "")).strip()
-        if not service_name:
-            continue
-        runtime[service_name] = {
-            "state": str(container.get("State", "")).strip().lower(),
-            "health": str(container.get("Health", "")).strip().lower(),
-        }
-    return runtime
+    ``expected_lookup`` maps lowercased service names to their original form.
+    The candidate, its image/path tail, its ``host:port`` head and the service
+    part of a ``project_service_N`` container name are tried in turn, each
+    also with ``_`` and ``-`` swapped.
+    """
+    lowered = candidate.lower()
+    bases = [lowered]
+    if "/" in lowered:
+        bases.append(lowered.rsplit("/", 1)[-1])
+    if ":" in lowered:
+        bases.append(lowered.split(":", 1)[0])
+    container_name_match = _COMPOSE_CONTAINER_RE.match(lowered)
+    if container_name_match:
+        bases.append(container_name_match.group(1))
+
+    for base in bases:
+        for variant in (base, base.replace("_", "-"), base.replace("-", "_")):
+            service = expected_lookup.get(variant)
+            if service:
+                return service
+    return ""
 
 
 def _build_target_service_status(
@@ -1230,51 +1569,29 @@ def _build_target_service_status(
     runtime_health_by_service: Optional[Dict[str, Dict[str, str]]] = None,
 ) -> List[Dict[str, str]]:
     """Map expected compose services to their Prometheus target health."""
-    expected_lookup = {service.lower(): service for service in expected_services}
+    expected_pairs = [(service, service.lower()) for service in expected_services]
+    expected_lookup = {lowered: service for service, lowered in expected_pairs}
+
+    resolved_candidates: Dict[str, str] = {}
 
     def _resolve_expected_service_name(raw_candidate: str) -> str:
         candidate = str(raw_candidate or "").strip().lstrip("/")
         if not candidate:
             return ""
-
-        variants = {candidate}
-        variants.add(candidate.lower())
-
-        if "/" in candidate:
-            tail = candidate.rsplit("/", 1)[-1]
-            variants.add(tail)
-            variants.add(tail.lower())
-        if ":" in candidate:
-            head = candidate.split(":", 1)[0]
-            variants.add(head)
-            variants.add(head.lower())
-
-        container_name_match = re.match(r"^[^_]+_([^_]+)_\d+$", candidate)
-        if container_name_match:
-            service_candidate = container_name_match.group(1)
-            variants.add(service_candidate)
-            variants.add(service_candidate.lower())
-
-        normalized_variants = set(variants)
-        normalized_variants.update(value.replace("_", "-") for value in variants)
-        normalized_variants.update(value.replace("-", "_") for value in variants)
-
-        for variant in normalized_variants:
-            direct_match = expected_lookup.get(variant)
-            if direct_match:
-                return direct_match
-            lower_match = expected_lookup.get(variant.lower())
-            if lower_match:
-                return lower_match
-        return ""
+        # Targets repeat the same job/pool names, so resolve each string once.
+        resolved = resolved_candidates.get(candidate)
+        if resolved is None:
+            resolved = _match_expected_service(candidate, expected_lookup)
+            resolved_candidates[candidate] = resolved
+        return resolved
 
     status_by_service: Dict[str, str] = {
         service: "unknown" for service in expected_services
     }
 
     for target in active_targets:
-        labels = target.get("labels", {}) or {}
-        discovered_labels = target.get("discoveredLabels", {}) or {}
+        labels = target.get("labels") or _EMPTY_MAPPING
+        discovered_labels = target.get("discoveredLabels") or _EMPTY_MAPPING
         candidates = [
             str(labels.get("container_label_com_docker_compose_service", "")).strip(),
             str(
@@ -1297,13 +1614,14 @@ def _build_target_service_status(
             elif current != "up" and health in {"down", "unknown"}:
                 status_by_service[service_name] = health
 
-    recently_seen = {
-        str(service).strip().lower() for service in (recently_seen_services or [])
-    }
+    recently_seen = frozenset(
+        str(service).strip().lower() for service in (recently_seen_services or ())
+    )
 
-    for service, health in list(status_by_service.items()):
-        if health == "unknown" and service.lower() in recently_seen:
-            status_by_service[service] = "up"
+    if recently_seen:
+        for service, lowered in expected_pairs:
+            if status_by_service[service] == "unknown" and lowered in recently_seen:
+                status_by_service[service] = "up"
 
     healthcheck_lookup = {
         str(name).lower(): bool(enabled)
@@ -1315,12 +1633,12 @@ def _build_target_service_status(
     }
 
     services: List[Dict[str, str]] = []
-    for service in expected_services:
+    for service, lowered in expected_pairs:
         prometheus_health = status_by_service.get(service, "unknown")
-        runtime = runtime_lookup.get(service.lower(), {})
+        runtime = runtime_lookup.get(lowered, _EMPTY_MAPPING)
         state = str(runtime.get("state", "")).lower()
         healthcheck_state = str(runtime.get("health", "")).lower()
-        has_healthcheck = healthcheck_lookup.get(service.lower(), False)
+        has_healthcheck = healthcheck_lookup.get(lowered, False)
         if not has_healthcheck and healthcheck_state:
             has_healthcheck = True
 
@@ -1362,10 +1680,6 @@ def resource_monitoring_view(request, conn=None, url=None, **kwargs):
 @require_root_user
 def resource_monitoring_data(request, conn=None, url=None, **kwargs):
     """Return monitoring endpoint URLs for Grafana and Prometheus dashboards."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
-
     grafana_base_url = os.environ.get("ADMIN_TOOLS_GRAFANA_URL", "http://grafana:3000")
     prometheus_base_url = os.environ.get(
         "ADMIN_TOOLS_PROMETHEUS_URL", "http://prometheus:9090"
@@ -1385,12 +1699,8 @@ def resource_monitoring_data(request, conn=None, url=None, **kwargs):
         request.META.get("HTTP_X_FORWARDED_PROTO", "").strip().split(",")[0].strip()
     )
 
-    dashboard_uid = os.environ.get(
-        "ADMIN_TOOLS_GRAFANA_DASHBOARD_UID", "omero-infrastructure"
-    )
-    dashboard_slug = os.environ.get(
-        "ADMIN_TOOLS_GRAFANA_DASHBOARD_SLUG", "server-infrastructure"
-    )
+    dashboard_uid = GRAFANA_DASHBOARD_UID
+    dashboard_slug = GRAFANA_DASHBOARD_SLUG
 
     dashboard_query = urlencode(
         {
@@ -1509,26 +1819,21 @@ def resource_monitoring_data(request, conn=None, url=None, **kwargs):
         "services": [],
     }
     try:
-        targets_api = f"{prometheus_base_url.rstrip('/')}/api/v1/targets"
-        with urllib.request.urlopen(targets_api, timeout=5.0) as response:
-            payload = json.loads(response.read().decode("utf-8"))
+        # Dropped targets are never shown and can outnumber the active ones.
+        targets_api = f"{prometheus_base_url.rstrip('/')}/api/v1/targets?state=active"
+        try:
+            with open_backend_url(targets_api, timeout=5.0) as response:
+                payload = json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            exc.close()
+            raise
         active_targets = payload.get("data", {}).get("activeTargets", [])
         targets_overview["active"] = len(active_targets)
-        targets_overview["up"] = sum(
-            1
-            for target in active_targets
-            if str(target.get("health", "")).lower() == "up"
-        )
-        targets_overview["down"] = sum(
-            1
-            for target in active_targets
-            if str(target.get("health", "")).lower() == "down"
-        )
-        targets_overview["unknown"] = (
-            targets_overview["active"]
-            - targets_overview["up"]
-            - targets_overview["down"]
-        )
+        for target in active_targets:
+            health = str(target.get("health", "")).lower()
+            if health not in ("up", "down"):
+                health = "unknown"
+            targets_overview[health] += 1
 
         recently_seen_services: List[str] = []
         service_healthcheck_config, runtime_health_by_service = (
@@ -1541,7 +1846,7 @@ def resource_monitoring_data(request, conn=None, url=None, **kwargs):
         except Exception:
             logger.exception("Failed to fetch recently seen cAdvisor services")
 
-        all_services = sorted(set(expected_services) | set(recently_seen_services))
+        all_services = sorted({*expected_services, *recently_seen_services})
         targets_overview["services"] = _build_target_service_status(
             active_targets,
             all_services,
@@ -1589,10 +1894,6 @@ def resource_monitoring_data(request, conn=None, url=None, **kwargs):
 @require_root_user
 def grafana_proxy(request, subpath: str, conn=None, url=None, **kwargs):
     """Proxy Grafana HTTP responses through OMERO.web."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
-
     grafana_base_url = os.environ.get("ADMIN_TOOLS_GRAFANA_URL", "http://grafana:3000")
     grafana_public_url = os.environ.get("ADMIN_TOOLS_GRAFANA_PUBLIC_URL", "")
     backend_urls = _build_proxy_backend_urls(grafana_base_url, grafana_public_url)
@@ -1615,6 +1916,9 @@ def grafana_proxy(request, subpath: str, conn=None, url=None, **kwargs):
 
     last_response = None
     for backend_url in backend_urls:
+        if last_response is not None:
+            # Release the rejected backend stream before trying the next one.
+            last_response.close()
         response = _proxy_http_request(
             request,
             backend_url,
@@ -1634,6 +1938,7 @@ def grafana_proxy(request, subpath: str, conn=None, url=None, **kwargs):
             subpath,
             ", ".join(backend_urls),
         )
+        last_response.close()
         return _grafana_unavailable_response(
             proxy_prefix=proxy_prefix,
             attempted_backends=backend_urls,
@@ -1647,10 +1952,6 @@ def grafana_proxy(request, subpath: str, conn=None, url=None, **kwargs):
 @require_root_user
 def prometheus_proxy(request, subpath: str, conn=None, url=None, **kwargs):
     """Proxy Prometheus HTTP responses through OMERO.web."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
-
     prometheus_base_url = os.environ.get(
         "ADMIN_TOOLS_PROMETHEUS_URL", "http://prometheus:9090"
     )
@@ -1678,6 +1979,9 @@ def prometheus_proxy(request, subpath: str, conn=None, url=None, **kwargs):
 
     last_response = None
     for backend_url in backend_urls:
+        if last_response is not None:
+            # Release the rejected backend stream before trying the next one.
+            last_response.close()
         response = _proxy_http_request(
             request,
             backend_url,
@@ -1693,6 +1997,68 @@ def prometheus_proxy(request, subpath: str, conn=None, url=None, **kwargs):
     return last_response
 
 
+def _iter_projection_pages(
+    query_service, query: str, service_opts, page_size: int
+) -> Iterator[list]:
+    """Yield projection rows one page at a time.
+
+    ``query`` must have a stable ``order by``. Each page is released before
+    the next is fetched, so peak memory is bounded by ``page_size`` rows.
+    """
+    offset = 0
+    while True:
+        params = ParametersI()
+        params.page(offset, page_size)
+        rows = query_service.projection(query, params, service_opts) or []
+        yield from rows
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
+
+def _cached_storage_data() -> Optional[bytes]:
+    """Return the cached storage payload, or None when absent or unavailable."""
+    try:
+        return cache.get(STORAGE_DATA_CACHE_KEY)
+    except Exception:
+        logger.warning("Storage data cache read failed", exc_info=True)
+        return None
+
+
+def _store_storage_data(content: bytes) -> None:
+    """Cache a freshly computed storage payload for a short time."""
+    try:
+        cache.set(STORAGE_DATA_CACHE_KEY, content, STORAGE_DATA_CACHE_TTL_SECONDS)
+    except Exception:
+        logger.warning("Storage data cache write failed", exc_info=True)
+
+
+def _invalidate_storage_data_cache() -> None:
+    """Drop the cached storage payload after quota changes."""
+    try:
+        cache.delete(STORAGE_DATA_CACHE_KEY)
+    except Exception:
+        logger.warning("Storage data cache invalidation failed", exc_info=True)
+
+
+def _storage_data_response(request, content: bytes) -> HttpResponseBase:
+    """Return storage JSON with an ETag so unchanged polls can get a 304."""
+    etag = f'"{hashlib.sha1(content).hexdigest()}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(content, content_type="application/json")
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _largest_first(items: Iterable, key, top: Optional[int]) -> list:
+    """Return ``items`` ordered by ``key`` descending, truncated to ``top``."""
+    if top is None:
+        return sorted(items, key=key, reverse=True)
+    return heapq.nlargest(top, items, key=key)
+
+
 @login_required()
 @require_root_user
 def storage_view(request, conn=None, url=None, **kwargs):
@@ -1703,49 +2069,67 @@ def storage_view(request, conn=None, url=None, **kwargs):
 @login_required()
 @require_root_user
 def storage_data(request, conn=None, url=None, **kwargs):
-    """Return size distribution by OMERO user and group using OriginalFile sizes."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
-
-    query = """
-        select e.id, e.omeName, g.id, g.name, sum(file.size)
-        from OriginalFile file
-        join file.details.owner e
-        join file.details.group g
-        group by e.id, e.omeName, g.id, g.name
+    """Return size distribution by OMERO user and group using OriginalFile sizes.
+
+    An optional ``top`` query parameter limits each breakdown to its largest
+    entries; totals always cover all users and groups.
     """
+    top: Optional[int] = None
+    top_raw = request.GET.get("top", "").strip()
+    if top_raw:
+        try:
+            top = int(top_raw)
+        except ValueError:
+            top = 0
+        if top < 1:
+            return JsonResponse({"error": "Invalid top value."}, status=400)
+
+    # Only the full payload the storage page polls is cached.
+    if top is None:
+        cached_content = _cached_storage_data()
+        if cached_content is not None:
+            return _storage_data_response(request, cached_content)
+
+    # statvfs on a network-mounted data root can block; overlap it with the
+    # OMERO queries below instead of running it afterwards.
+    data_root = os.environ.get("OMERO_DATA_DIR", "/OMERO")
+    disk_usage_future = _BLOCKING_IO_EXECUTOR.submit(shutil.disk_usage, data_root)
+
     per_user_group = []
-    totals_by_user: Dict[str, int] = {}
+    totals_by_user: DefaultDict[str, int] = defaultdict(int)
     full_name_by_user: Dict[str, str] = {}
-    groups_by_user: Dict[str, set] = {}
-    totals_by_group: Dict[str, int] = {}
-    users_by_group: Dict[str, set] = {}
+    groups_by_user: DefaultDict[str, set] = defaultdict(set)
+    totals_by_group: DefaultDict[str, int] = defaultdict(int)
+    users_by_group: DefaultDict[str, set] = defaultdict(set)
     total_size = 0
 
     try:
         service_opts = conn.SERVICE_OPTS
         if hasattr(service_opts, "setOmeroGroup"):
             service_opts.setOmeroGroup(-1)
-        rows = conn.getQueryService().projection(query, None, service_opts)
+        rows = _iter_projection_pages(
+            conn.getQueryService(),
+            _STORAGE_DISTRIBUTION_HQL,
+            service_opts,
+            STORAGE_QUERY_PAGE_SIZE,
+        )
+        unwrap = _unwrap_rtype_value
+        add_user_group = per_user_group.append
         for row in rows:
-            user_name = str(_unwrap_rtype_value(row[1], "unknown") or "unknown")
-            group_name = str(_unwrap_rtype_value(row[3], "unknown") or "unknown")
-            size_raw = _unwrap_rtype_value(row[4], 0)
-            size_value = int(size_raw or 0)
-            per_user_group.append(
+            user_name = str(unwrap(row[1], "unknown") or "unknown")
+            group_name = str(unwrap(row[3], "unknown") or "unknown")
+            size_value = int(unwrap(row[4], 0) or 0)
+            add_user_group(
                 {
                     "username": user_name,
                     "group": group_name,
                     "bytes": size_value,
                 }
             )
-            totals_by_user[user_name] = totals_by_user.get(user_name, 0) + size_value
-            groups_by_user.setdefault(user_name, set()).add(group_name)
-            totals_by_group[group_name] = (
-                totals_by_group.get(group_name, 0) + size_value
-            )
-            users_by_group.setdefault(group_name, set()).add(user_name)
+            totals_by_user[user_name] += size_value
+            groups_by_user[user_name].add(group_name)
+            totals_by_group[group_name] += size_value
+            users_by_group[group_name].add(user_name)
             total_size += size_value
 
         (
@@ -1757,15 +2141,15 @@ def storage_data(request, conn=None, url=None, **kwargs):
         ) = _list_all_users_and_groups(conn)
         for username, full_name in all_users.items():
             totals_by_user.setdefault(username, 0)
-            groups_by_user.setdefault(username, set()).update(
-                all_groups_by_user.get(username, set())
-            )
+            extra_groups = all_groups_by_user.get(username)
+            if extra_groups:
+                groups_by_user[username].update(extra_groups)
             full_name_by_user[username] = full_name
         for group_name in all_groups:
             totals_by_group.setdefault(group_name, 0)
-            users_by_group.setdefault(group_name, set()).update(
-                all_users_by_group.get(group_name, set())
-            )
+            extra_users = all_users_by_group.get(group_name)
+            if extra_users:
+                users_by_group[group_name].update(extra_users)
             group_permissions.setdefault(group_name, "Private")
 
         for username in totals_by_user:
@@ -1774,10 +2158,9 @@ def storage_data(request, conn=None, url=None, **kwargs):
         logger.exception("Failed to compute storage distribution")
         return JsonResponse({"error": f"Storage query failed: {exc}"}, status=500)
 
-    data_root = os.environ.get("OMERO_DATA_DIR", "/OMERO")
     data_total = data_used = data_free = None
     try:
-        data_total, data_used, data_free = shutil.disk_usage(data_root)
+        data_total, data_used, data_free = disk_usage_future.result()
     except Exception:
         logger.warning("Could not read disk usage for data root %s", data_root)
 
@@ -1803,7 +2186,7 @@ def storage_data(request, conn=None, url=None, **kwargs):
             "quota_enforcement_available": enforcer_available,
         }
 
-    return JsonResponse(
+    content = JsonResponse(
         {
             "totals": {
                 "omero_binary_bytes": total_size,
@@ -1815,31 +2198,35 @@ def storage_data(request, conn=None, url=None, **kwargs):
             "by_user": [
                 {
                     "username": username,
-                    "full_name": full_name_by_user.get(username, ""),
-                    "groups": sorted(groups_by_user.get(username, set())),
+                    "full_name": full_name_by_user[username],
+                    "groups": sorted(groups_by_user.get(username, ())),
                     "bytes": size,
                 }
-                for username, size in sorted(
-                    totals_by_user.items(), key=lambda item: item[1], reverse=True
+                for username, size in _largest_first(
+                    totals_by_user.items(), key=itemgetter(1), top=top
                 )
             ],
             "by_group": [
                 {
                     "group": groupname,
-                    "users": sorted(users_by_group.get(groupname, set())),
+                    "users": sorted(users_by_group.get(groupname, ())),
                     "permissions": group_permissions.get(groupname, "Private"),
                     "bytes": size,
                 }
-                for groupname, size in sorted(
-                    totals_by_group.items(), key=lambda item: item[1], reverse=True
+                for groupname, size in _largest_first(
+                    totals_by_group.items(), key=itemgetter(1), top=top
                 )
             ],
-            "by_user_group": sorted(
-                per_user_group, key=lambda item: item["bytes"], reverse=True
+            "by_user_group": _largest_first(
+                per_user_group, key=itemgetter("bytes"), top=top
             ),
             "quotas": quota_status,
-        }
-    )
+        },
+        json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
+    ).content
+    if top is None:
+        _store_storage_data(content)
+    return _storage_data_response(request, content)
 
 
 @csrf_exempt
@@ -1847,10 +2234,6 @@ def storage_data(request, conn=None, url=None, **kwargs):
 @require_root_user
 def storage_quota_data(request, conn=None, url=None, **kwargs):
     """Fetch persisted quota definitions and reconciliation logs."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
-
     try:
         state = get_quota_state()
     except Exception:
@@ -1882,7 +2265,8 @@ def storage_quota_data(request, conn=None, url=None, **kwargs):
             "quotas_gb": state.get("quotas_gb", {}),
             "logs": state.get("logs", []),
             "reconcile": reconciled,
-        }
+        },
+        json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
     )
 
 
@@ -1891,9 +2275,6 @@ def storage_quota_data(request, conn=None, url=None, **kwargs):
 @require_root_user
 def storage_quota_update(request, conn=None, url=None, **kwargs):
     """Update group quota values from UI edits."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
     if request.method != "POST":
         return JsonResponse({"error": "Method not allowed"}, status=405)
 
@@ -1938,6 +2319,7 @@ def storage_quota_update(request, conn=None, url=None, **kwargs):
     # ---- persist and reconcile ----
     try:
         state = upsert_quotas(normalized, source="ui-edit")
+        _invalidate_storage_data_cache()
         known_groups = _list_omero_group_names(conn)
         reconciled = reconcile_quotas(known_groups)
     except Exception as exc:
@@ -1948,7 +2330,8 @@ def storage_quota_update(request, conn=None, url=None, **kwargs):
         {
             "quotas_gb": state.get("quotas_gb", {}),
             "reconcile": reconciled,
-        }
+        },
+        json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
     )
 
 
@@ -1957,25 +2340,39 @@ def storage_quota_update(request, conn=None, url=None, **kwargs):
 @require_root_user
 def storage_quota_import(request, conn=None, url=None, **kwargs):
     """Import group quotas from a CSV upload."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
     if request.method != "POST":
         return JsonResponse({"error": "Method not allowed"}, status=405)
 
     if "file" not in request.FILES:
         return JsonResponse({"error": "Missing file upload field 'file'"}, status=400)
     csv_file = request.FILES["file"]
+    if csv_file.size > QUOTA_CSV_MAX_BYTES:
+        return JsonResponse(
+            {
+                "error": (
+                    "Invalid CSV import: file exceeds "
+                    f"{QUOTA_CSV_MAX_BYTES // (1024 * 1024)} MB limit"
+                )
+            },
+            status=413,
+        )
 
     # ---- parse CSV ----
+    raw_content = csv_file.read()
+    if raw_content.translate(None, _QUOTA_CSV_ALLOWED_BYTES):
+        return JsonResponse(
+            {"error": "Invalid CSV import: file contains binary control characters"},
+            status=415,
+        )
     try:
-        content = csv_file.read().decode("utf-8")
+        content = raw_content.decode("utf-8")
     except UnicodeDecodeError as exc:
         return JsonResponse({"error": f"Invalid CSV import: {exc}"}, status=400)
 
     # ---- persist and reconcile ----
     try:
         state = import_quotas_csv(content)
+        _invalidate_storage_data_cache()
         known_groups = _list_omero_group_names(conn)
         reconciled = reconcile_quotas(known_groups)
     except (QuotaError, CsvError) as exc:
@@ -1988,7 +2385,8 @@ def storage_quota_import(request, conn=None, url=None, **kwargs):
         {
             "quotas_gb": state.get("quotas_gb", {}),
             "reconcile": reconciled,
-        }
+        },
+        json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
     )
 
 
@@ -1996,10 +2394,6 @@ def storage_quota_import(request, conn=None, url=None, **kwargs):
 @require_root_user
 def storage_quota_template(request, conn=None, url=None, **kwargs):
     """Download quota CSV template."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
-
     template = quota_csv_template()
     response = HttpResponse(template, content_type="text/csv; charset=utf-8")
     response["Content-Disposition"] = 'attachment; filename="group-quotas-template.csv"'
@@ -2022,9 +2416,6 @@ def server_database_testing_view(request, conn=None, url=None, **kwargs):
 @require_root_user
 def server_database_testing_run(request, conn=None, url=None, **kwargs):
     """Execute selected diagnostics scripts and return a report."""
-    root_error = _require_root_user(request, conn)
-    if root_error:
-        return root_error
     if request.method != "POST":
         return JsonResponse({"error": "POST method required."}, status=405)
     try:
@@ -2058,9 +2449,11 @@ def server_database_testing_run(request, conn=None, url=None, **kwargs):
         ", ".join(normalized_script_ids),
     )
     try:
-        results = [
-            run_diagnostic_script(script_id) for script_id in normalized_script_ids
-        ]
+        # Scripts are independent and IO-bound; map keeps the request order.
+        with ThreadPoolExecutor(
+            max_workers=min(DIAGNOSTICS_MAX_WORKERS, len(normalized_script_ids))
+        ) as executor:
+            results = list(executor.map(run_diagnostic_script, normalized_script_ids))
     except Exception as exc:
         logger.error(
             "[%s] Failed to run diagnostics scripts %s: %s\n%s",
@@ -2082,4 +2475,7 @@ def server_database_testing_run(request, conn=None, url=None, **kwargs):
         request_id,
         ", ".join(normalized_script_ids),
     )
-    return JsonResponse({"results": results, "request_id": request_id})
+    return JsonResponse(
+        {"results": results, "request_id": request_id},
+        json_dumps_params=COMPACT_JSON_DUMPS_PARAMS,
+    )
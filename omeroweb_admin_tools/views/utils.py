@@ -1,26 +1,73 @@
+import json
+import time
 from functools import wraps
 
-from django.http import JsonResponse
+from django.http import HttpResponse
 
 from omero_plugin_common.request_utils import current_username
 
+ROOT_CHECK_SESSION_KEY = "_admin_tools_root_check"
+ROOT_CHECK_TTL_SECONDS = 60.0
+# The rejection body never changes, so it is serialized once.
+_ROOT_REQUIRED_BODY = json.dumps(
+    {"error": "PLEASE LOGIN AS ROOT USER\nTO USE THIS PLUGIN"}
+).encode("utf-8")
+
+
+def _omero_session_key(conn):
+    """Return the OMERO session key behind ``conn``, or None when unknown."""
+    try:
+        session_key = conn.getSessionId()
+    except Exception:
+        return None
+    return str(session_key) if session_key else None
+
+
+def is_root_user(request, conn) -> bool:
+    """Return whether the current user is root, caching positive checks.
+
+    A successful check is remembered on the Django session for
+    ``ROOT_CHECK_TTL_SECONDS`` together with the OMERO session key that
+    passed it, so follow-up admin requests over the same OMERO session skip
+    the user lookup. Negative results, and connections without a session
+    key, are never cached. Wall-clock time is used because the session is
+    shared between web worker processes.
+    """
+    session = getattr(request, "session", None)
+    omero_session_key = _omero_session_key(conn)
+    now = time.time()
+    if session is not None and omero_session_key is not None:
+        cached = session.get(ROOT_CHECK_SESSION_KEY)
+        if (
+            isinstance(cached, dict)
+            and cached.get("omero_session") == omero_session_key
+            and isinstance(cached.get("until"), (int, float))
+            and cached["until"] > now
+        ):
+            return True
+
+    is_root = current_username(request, conn) == "root"
+    if session is not None:
+        if is_root and omero_session_key is not None:
+            session[ROOT_CHECK_SESSION_KEY] = {
+                "omero_session": omero_session_key,
+                "until": now + ROOT_CHECK_TTL_SECONDS,
+            }
+        else:
+            session.pop(ROOT_CHECK_SESSION_KEY, None)
+    return is_root
+
 
 def require_root_user(view_func):
     @wraps(view_func)
     def _wrapped(request, conn=None, url=None, *args, **kwargs):
-        username = current_username(request, conn)
-        if username != "root":
-            return JsonResponse(
-                {
-                    "error": (
-                        "PLEASE LOGIN AS ROOT USER\nTO USE THIS PLUGIN"
-                    )
-                },
-                status=403,
+        if not is_root_user(request, conn):
+            return HttpResponse(
+                _ROOT_REQUIRED_BODY, status=403, content_type="application/json"
             )
         return view_func(request, conn=conn, url=url, *args, **kwargs)
 
     return _wrapped
 
 
-__all__ = ["current_username", "require_root_user"]
+__all__ = ["current_username", "is_root_user", "require_root_user"]
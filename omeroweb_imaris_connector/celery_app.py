@@ -31,8 +31,10 @@ app.conf.update(
     task_acks_late=True,
 )
 
-# autodiscover_tasks handles the import properly without circular dependency
-app.autodiscover_tasks(["omeroweb_imaris_connector"], force=True)
 
-# REMOVED: The explicit import that caused the circular dependency
-# The autodiscover_tasks call above is sufficient to register the task
+@app.on_after_configure.connect
+def _discover_tasks(sender, **kwargs):
+    # Discovery runs once the configuration is loaded (worker start-up), not
+    # on every import of this module. Importing tasks from here instead of at
+    # module level keeps the tasks -> celery_app import free of cycles.
+    sender.autodiscover_tasks(["omeroweb_imaris_connector"], force=True)
@@ -4,6 +4,7 @@ from omero_plugin_common.env_utils import (
     get_env,
     get_float_env,
     get_int_env,
+    get_optional_env,
     require_env,
 )
 
@@ -26,8 +27,6 @@ def get_job_service_credentials() -> tuple[str | None, str | None]:
     
     Prefers OMERO_WEB_JOB_SERVICE_* variables, falls back to OMERO_JOB_SERVICE_*.
     """
-    from omero_plugin_common.env_utils import get_optional_env
-    
     # Try web-specific first
     username = get_optional_env(
         "OMERO_WEB_JOB_SERVICE_USERNAME",
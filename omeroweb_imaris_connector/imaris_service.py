@@ -6,6 +6,7 @@ import threading
 import time
 import uuid
 import omero
+from functools import lru_cache
 from typing import Callable, Iterator
 
 from omero.rtypes import rint
@@ -25,12 +26,16 @@ SCRIPT_NAME = get_env(
     env_file=ENV_FILE_OMERO_CELERY,
 )
 SCRIPT_BASENAME = os.path.splitext(SCRIPT_NAME)[0]
+_SCRIPT_MATCH_NAMES = frozenset({SCRIPT_NAME, SCRIPT_BASENAME})
 EXPORT_ROOT = get_env(
     "OMERO_IMS_EXPORT_DIR",
     env_file=ENV_FILE_OMERO_CELERY,
 )
 EXPORT_TIMEOUT = get_export_timeout()
 EXPORT_POLL_INTERVAL = get_export_poll_interval()
+# Long exports back off to this poll interval to cut Ice round-trips.
+EXPORT_POLL_MAX_INTERVAL = max(EXPORT_POLL_INTERVAL, 5.0)
+EXPORT_POLL_BACKOFF = 1.5
 PROCESS_JOB_DIR = get_env(
     "OMERO_IMS_PROCESS_JOB_DIR",
     env_file=ENV_FILE_OMERO_CELERY,
@@ -51,6 +56,9 @@ PROCESSOR_CONFIG_CACHE_TTL = get_int_env(
 _PROCESS_JOBS = {}
 _PROCESS_JOBS_LOCK = threading.Lock()
 _PROCESSOR_CONFIG_CACHE = {"value": None, "checked_at": 0.0}
+_NODE_DESCRIPTORS_CACHE = {"value": None, "checked_at": 0.0}
+# Script ids are server-wide, so a resolved id is shared for the same TTL.
+_SCRIPT_ID_CACHE = {"value": None, "checked_at": 0.0}
 
 
 def _process_job_path(job_id):
@@ -69,25 +77,24 @@ def _write_process_job_file(job_id, payload):
     path = _process_job_path(job_id)
     tmp_path = f"{path}.tmp"
     try:
-        with open(tmp_path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle)
+        blob = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        with open(tmp_path, "wb") as handle:
+            handle.write(blob)
         os.replace(tmp_path, path)
     except Exception:
         logger.exception("Failed to write process job file for %s", job_id)
         try:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            os.remove(tmp_path)
         except Exception:
             pass
 
 
 def _read_process_job_file(job_id):
-    path = _process_job_path(job_id)
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        with open(_process_job_path(job_id), "rb") as handle:
+            return json.loads(handle.read())
+    except FileNotFoundError:
+        return None
     except Exception:
         logger.exception("Failed to read process job file for %s", job_id)
         return None
@@ -96,10 +103,7 @@ def _read_process_job_file(job_id):
 def _serialize_outputs(outputs):
     if not isinstance(outputs, dict):
         return None
-    serialized = {}
-    for key, value in outputs.items():
-        serialized[str(key)] = _unwrap_rtype(value)
-    return serialized
+    return {str(key): _unwrap_rtype(value) for key, value in outputs.items()}
 
 
 def _monitor_process_job(job_id, proc):
@@ -122,10 +126,11 @@ def _monitor_process_job(job_id, proc):
 def _register_process_job(proc):
     job_id = f"proc-{uuid.uuid4().hex}"
     logger.debug("Registering IMS process job %s", job_id)
+    created = time.time()
     with _PROCESS_JOBS_LOCK:
         _PROCESS_JOBS[job_id] = {
             "handle": proc,
-            "created": time.time(),
+            "created": created,
         }
     _write_process_job_file(
         job_id,
@@ -134,7 +139,7 @@ def _register_process_job(proc):
             "state": "RUNNING",
             "outputs": None,
             "error": None,
-            "created": time.time(),
+            "created": created,
         },
     )
     thread = threading.Thread(
@@ -158,6 +163,7 @@ def _forget_process_job(job_id):
 
 def _poll_process_job(job_id):
     logger.debug("Polling process job %s", job_id)
+    now = time.time()
     record = _get_process_job(job_id)
     if not record:
         file_record = _read_process_job_file(job_id)
@@ -169,14 +175,14 @@ def _poll_process_job(job_id):
         state = file_record.get("state")
         outputs = file_record.get("outputs")
         error = file_record.get("error")
-        if state == "RUNNING" and created and time.time() - created > EXPORT_TIMEOUT:
+        if state == "RUNNING" and created and now - created > EXPORT_TIMEOUT:
             state = "TIMEOUT"
             error = "Timed out waiting for IMS export job."
             file_record.update({"state": state, "error": error})
             _write_process_job_file(job_id, file_record)
         return state, outputs, error
 
-    if time.time() - record["created"] > EXPORT_TIMEOUT:
+    if now - record["created"] > EXPORT_TIMEOUT:
         _detach_script_process(record.get("handle"), reason="process job timeout")
         _forget_process_job(job_id)
         return "TIMEOUT", None, "Timed out waiting for IMS export job."
@@ -196,14 +202,15 @@ def _poll_process_job(job_id):
         outputs = proc.getResults(0)
     except Exception:
         outputs = None
-    logger.debug("Process job %s finished state=%s outputs=%s", job_id, state, _serialize_outputs(outputs))
+    serialized_outputs = _serialize_outputs(outputs)
+    logger.debug("Process job %s finished state=%s outputs=%s", job_id, state, serialized_outputs)
     _detach_script_process(proc, reason="process job completed")
     _write_process_job_file(
         job_id,
         {
             "job_id": job_id,
             "state": state,
-            "outputs": _serialize_outputs(outputs),
+            "outputs": serialized_outputs,
             "error": None,
             "created": record["created"],
         },
@@ -212,7 +219,13 @@ def _poll_process_job(job_id):
     return state, outputs, None
 
 
+_PLAIN_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _unwrap_rtype(v):
+    # Already-plain values are common in outputs; skip the attribute lookup.
+    if type(v) in _PLAIN_VALUE_TYPES:
+        return v
     # OMERO.rtypes: rstring/rlong/etc have .val
     try:
         return v.val
@@ -240,6 +253,25 @@ def _get_script_services(conn):
 
 
 def _find_script_id(conn):
+    now = time.time()
+    if (
+        _SCRIPT_ID_CACHE["value"]
+        and now - _SCRIPT_ID_CACHE["checked_at"] < PROCESSOR_CONFIG_CACHE_TTL
+    ):
+        return _SCRIPT_ID_CACHE["value"]
+    script_id = _lookup_script_id(conn)
+    if script_id:
+        _SCRIPT_ID_CACHE["value"] = script_id
+        _SCRIPT_ID_CACHE["checked_at"] = now
+    return script_id
+
+
+def _invalidate_script_id_cache():
+    _SCRIPT_ID_CACHE["value"] = None
+    _SCRIPT_ID_CACHE["checked_at"] = 0.0
+
+
+def _lookup_script_id(conn):
     for svc in _get_script_services(conn):
         try:
             scripts = svc.getScripts()
@@ -271,10 +303,10 @@ def _find_script_id(conn):
                 basename_no_ext = os.path.splitext(basename)[0]
                 candidate_no_ext = os.path.splitext(candidate)[0]
                 if (
-                    candidate in {SCRIPT_NAME, SCRIPT_BASENAME}
-                    or candidate_no_ext in {SCRIPT_NAME, SCRIPT_BASENAME}
-                    or basename in {SCRIPT_NAME, SCRIPT_BASENAME}
-                    or basename_no_ext in {SCRIPT_NAME, SCRIPT_BASENAME}
+                    candidate in _SCRIPT_MATCH_NAMES
+                    or candidate_no_ext in _SCRIPT_MATCH_NAMES
+                    or basename in _SCRIPT_MATCH_NAMES
+                    or basename_no_ext in _SCRIPT_MATCH_NAMES
                 ):
                     return int(sid)
     return None
@@ -333,50 +365,59 @@ def _resolve_async_result(svc, meth_name, async_result):
     return async_result
 
 
+_PREFERRED_SCRIPT_METHODS = (
+    "runScriptAsync",
+    "runScript",
+    "run_script",
+    "run",
+    "runScript_async",
+    "run_script_async",
+    "runScriptEx",
+    "executeScript",
+    "execute_script",
+)
+
+
+@lru_cache(maxsize=16)
+def _discover_script_method_names(svc_cls):
+    """Return run/exec-style script method names defined on ``svc_cls``."""
+    names = []
+    for name in dir(svc_cls):
+        if name in _PREFERRED_SCRIPT_METHODS:
+            continue
+        lowered = name.lower()
+        if lowered.startswith("begin_") or lowered.startswith("end_"):
+            continue
+        if "canrun" in lowered or "can_run" in lowered:
+            continue
+        if "script" not in lowered:
+            continue
+        if "run" not in lowered and "exec" not in lowered:
+            continue
+        names.append(name)
+    return tuple(names)
+
+
 def _iter_script_methods(svc):
-    preferred = [
-        "runScriptAsync",
-        "runScript",
-        "run_script",
-        "run",
-        "runScript_async",
-        "run_script_async",
-        "runScriptEx",
-        "executeScript",
-        "execute_script",
-    ]
-    seen = set()
-    for name in preferred:
+    for name in _PREFERRED_SCRIPT_METHODS:
         try:
             meth = getattr(svc, name, None)
         except Exception:
             meth = None
         if callable(meth):
-            seen.add(name)
             yield name, meth
     try:
-        for name in dir(svc):
-            if name in seen:
-                continue
-            lowered = name.lower()
-            if lowered.startswith("begin_") or lowered.startswith("end_"):
-                continue
-            if "canrun" in lowered or "can_run" in lowered:
-                continue
-            lower_name = name.lower()
-            if "script" not in lower_name:
-                continue
-            if "run" not in lower_name and "exec" not in lower_name:
-                continue
-            try:
-                meth = getattr(svc, name, None)
-            except Exception:
-                meth = None
-            if callable(meth):
-                seen.add(name)
-                yield name, meth
+        names = _discover_script_method_names(type(svc))
     except Exception:
         logger.exception("Failed to introspect ScriptService methods")
+        return
+    for name in names:
+        try:
+            meth = getattr(svc, name, None)
+        except Exception:
+            meth = None
+        if callable(meth):
+            yield name, meth
 
 
 def _call_script_method(meth, meth_name, script_id, inputs, wait_secs):
@@ -468,6 +509,7 @@ def _run_script(
 
     services = _get_script_services(conn)
     if not services:
+        _invalidate_script_id_cache()
         raise RuntimeError("Could not start script: ScriptService unavailable")
 
     # Use a single, known-good call path:
@@ -555,6 +597,8 @@ def _run_script(
                     "handles or too many concurrent starts.)"
                 ) from exc
 
+            # The cached id may point at a script that was replaced or removed.
+            _invalidate_script_id_cache()
             raise
 
 
@@ -617,6 +661,12 @@ def _get_node_descriptors_config(conn):
             "Skipping omero.server.nodedescriptors lookup for non-admin session."
         )
         return None
+    now = time.time()
+    if (
+        _NODE_DESCRIPTORS_CACHE["checked_at"]
+        and now - _NODE_DESCRIPTORS_CACHE["checked_at"] < PROCESSOR_CONFIG_CACHE_TTL
+    ):
+        return _NODE_DESCRIPTORS_CACHE["value"]
     try:
         config_service = conn.c.sf.getConfigService()
         if config_service is None:
@@ -627,6 +677,8 @@ def _get_node_descriptors_config(conn):
         value = str(value).strip()
         if not value:
             return None
+        _NODE_DESCRIPTORS_CACHE["value"] = value
+        _NODE_DESCRIPTORS_CACHE["checked_at"] = now
         return value
     except Exception as exc:
         if _is_security_violation(exc):
@@ -650,6 +702,9 @@ def _format_script_exception(exc: Exception) -> str:
     return str(exc)
 
 
+_NO_PROCESSOR_MESSAGE_RE = re.compile(r"NoProcessorAvailable|No processor available")
+
+
 def _is_security_violation(exc: Exception) -> bool:
     for err in _iter_exception_chain(exc):
         name = err.__class__.__name__
@@ -669,10 +724,7 @@ def _is_no_processor_available(exc: Exception) -> bool:
         name = err.__class__.__name__
         if name == "NoProcessorAvailable":
             return True
-        message = str(err)
-        if "NoProcessorAvailable" in message:
-            return True
-        if "No processor available" in message:
+        if _NO_PROCESSOR_MESSAGE_RE.search(str(err)):
             return True
     return False
 
@@ -760,14 +812,15 @@ def _get_job_state_and_outputs(conn, job_id):
                 try:
                     state = state_fn(job_id)
                     outputs = out_fn(job_id)
-                    logger.debug(
-                        "Job %s state via %s/%s: %s outputs=%s",
-                        job_id,
-                        state_m,
-                        out_m,
-                        state,
-                        _serialize_outputs(outputs),
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Job %s state via %s/%s: %s outputs=%s",
+                            job_id,
+                            state_m,
+                            out_m,
+                            state,
+                            _serialize_outputs(outputs),
+                        )
                     return str(_unwrap_rtype(state)), outputs
                 except Exception:
                     pass
@@ -778,7 +831,8 @@ def _get_job_state_and_outputs(conn, job_id):
             try:
                 outputs = out_fn(job_id)
                 if outputs:
-                    logger.debug("Job %s outputs via outputs-only path: %s", job_id, _serialize_outputs(outputs))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Job %s outputs via outputs-only path: %s", job_id, _serialize_outputs(outputs))
                     return "FINISHED", outputs
             except Exception:
                 pass
@@ -804,7 +858,8 @@ def _get_job_state_and_outputs(conn, job_id):
                                 outputs = out_fn(job_id)
                             except Exception:
                                 outputs = None
-                        logger.debug("Job %s state via getJobs(): %s outputs=%s", job_id, status, _serialize_outputs(outputs))
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Job %s state via getJobs(): %s outputs=%s", job_id, status, _serialize_outputs(outputs))
                         return str(status), outputs
                     except Exception:
                         continue
@@ -817,26 +872,32 @@ def _get_job_state_and_outputs(conn, job_id):
 def _wait_for_process(proc, timeout):
     deadline = time.time() + timeout
     last_state = None
+    delay = EXPORT_POLL_INTERVAL
     try:
-        while time.time() < deadline:
+        while True:
             try:
                 last_state = _normalize_job_state(proc.poll())
             except Exception:
                 last_state = None
             if last_state:
                 break
-            time.sleep(EXPORT_POLL_INTERVAL)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * EXPORT_POLL_BACKOFF, EXPORT_POLL_MAX_INTERVAL)
         outputs = None
         if last_state:
             try:
                 outputs = proc.getResults(0)
             except Exception:
                 outputs = None
-        logger.debug(
-            "Process wait completed state=%s outputs=%s",
-            last_state,
-            _serialize_outputs(outputs),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Process wait completed state=%s outputs=%s",
+                last_state,
+                _serialize_outputs(outputs),
+            )
         return last_state, outputs
     finally:
         _detach_script_process(proc, reason="process wait completed")
@@ -845,28 +906,28 @@ def _wait_for_process(proc, timeout):
 def _normalize_job_state(state):
     if state is None:
         return None
+    # Plain values have none of the wrapper attributes probed below.
+    if type(state) not in _PLAIN_VALUE_TYPES:
+        try:
+            if hasattr(state, "val"):
+                state = state.val
+        except Exception:
+            pass
+        try:
+            if hasattr(state, "getValue"):
+                state = state.getValue()
+        except Exception:
+            pass
+        try:
+            if hasattr(state, "name"):
+                state = state.name
+        except Exception:
+            pass
     try:
-        if hasattr(state, "val"):
-            state = state.val
-    except Exception:
-        pass
-    try:
-        if hasattr(state, "getValue"):
-            state = state.getValue()
-    except Exception:
-        pass
-    try:
-        if hasattr(state, "name"):
-            state = state.name
-    except Exception:
-        pass
-    try:
-        state = str(state).strip()
+        state = str(state).strip().upper()
     except Exception:
         return None
-    if not state:
-        return None
-    return state.upper()
+    return state or None
 
 
 def _detach_script_process(proc, reason=""):
@@ -933,14 +994,18 @@ def _raw_file_generator(store, size, chunk_size=8 * 1024 * 1024):
             pass
 
 
+# Drops control characters and maps path separators to "_" in one pass.
+_FILENAME_TRANSLATION = {
+    **dict.fromkeys(range(0x20)),
+    0x7F: None,
+    **{ord(sep): "_" for sep in (os.sep, os.altsep) if sep},
+}
+
+
 def _sanitize_filename(filename, fallback="export.ims"):
     if not filename:
         return fallback
-    safe_name = os.path.basename(str(filename))
-    safe_name = re.sub(r"[\x00-\x1f\x7f]+", "", safe_name)
-    safe_name = safe_name.replace(os.sep, "_")
-    if os.altsep:
-        safe_name = safe_name.replace(os.altsep, "_")
+    safe_name = os.path.basename(str(filename)).translate(_FILENAME_TRANSLATION)
     safe_name = safe_name.strip().strip(". ")
     if not safe_name:
         return fallback
@@ -31,6 +31,10 @@ except RuntimeError as e:
     EXPORT_ROOT = "/OMERO/ImarisExports"
     print(f"WARNING: {e}")
     print(f"WARNING: Falling back to default OMERO_IMS_EXPORT_DIR={EXPORT_ROOT}")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^A-Za-z0-9._ -]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _safe_filename(name, fallback="image"):
     """Create a filesystem-safe filename (no path separators, no control chars)."""
     if name is None:
@@ -45,8 +49,8 @@ def _safe_filename(name, fallback="image"):
     if os.altsep:
         name = name.replace(os.altsep, "_")
     # Keep a conservative whitelist.
-    name = re.sub(r"[^A-Za-z0-9._ -]+", "_", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _UNSAFE_FILENAME_CHARS_RE.sub("_", name)
+    name = _WHITESPACE_RE.sub(" ", name).strip()
     # Limit length to avoid filesystem/path issues.
     if len(name) > 200:
         name = name[:200].rstrip()
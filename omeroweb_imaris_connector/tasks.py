@@ -202,12 +202,13 @@ def run_ims_export_task(self, image_id, session_key, host, port, secure=None):
         # _wait_for_process detaches in its finally block (frees Processor slot).
         logger.debug("IMS export polling process handle for image_id=%s", image_id)
         last_state, outputs = _wait_for_process(proc, EXPORT_TIMEOUT)
-        logger.debug(
-            "IMS export process completed image_id=%s state=%s outputs=%s",
-            image_id,
-            last_state,
-            _serialize_outputs(outputs),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "IMS export process completed image_id=%s state=%s outputs=%s",
+                image_id,
+                last_state,
+                _serialize_outputs(outputs),
+            )
 
         if not last_state:
             raise RuntimeError("Could not determine IMS export job status.")
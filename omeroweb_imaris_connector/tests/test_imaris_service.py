@@ -199,6 +199,11 @@ def test_run_script_fails_fast_when_processor_missing(
         "_PROCESSOR_CONFIG_CACHE",
         {"value": None, "checked_at": 0.0},
     )
+    monkeypatch.setattr(
+        imaris_service,
+        "_NODE_DESCRIPTORS_CACHE",
+        {"value": None, "checked_at": 0.0},
+    )
 
     with pytest.raises(
         RuntimeError, match="nodedescriptors does not include a Processor"
@@ -208,6 +213,69 @@ def test_run_script_fails_fast_when_processor_missing(
     assert service.calls == 1
 
 
+def test_node_descriptors_config_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+    monkeypatch.setattr(
+        imaris_service,
+        "_NODE_DESCRIPTORS_CACHE",
+        {"value": None, "checked_at": 0.0},
+    )
+    lookups = []
+
+    class DummyConfigService:
+        def getConfigValue(self, key):
+            lookups.append(key)
+            return "master:Blitz-0,Processor-0"
+
+    conn = types.SimpleNamespace(
+        c=types.SimpleNamespace(
+            sf=types.SimpleNamespace(getConfigService=lambda: DummyConfigService())
+        ),
+        isAdmin=lambda: True,
+    )
+
+    for _ in range(3):
+        assert (
+            imaris_service._get_node_descriptors_config(conn)
+            == "master:Blitz-0,Processor-0"
+        )
+    assert lookups == ["omero.server.nodedescriptors"]
+
+
+def test_find_script_id_caches_resolved_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+
+    class DummyService:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def getScripts(self):
+            self.calls += 1
+            return [
+                types.SimpleNamespace(name="Other.py", path="/omero/", id=7),
+                types.SimpleNamespace(name="IMS_Export.py", path="/omero/", id=42),
+            ]
+
+    monkeypatch.setattr(
+        imaris_service, "_SCRIPT_ID_CACHE", {"value": None, "checked_at": 0.0}
+    )
+    service = DummyService()
+    conn = types.SimpleNamespace(
+        getScriptService=lambda: service,
+        c=types.SimpleNamespace(sf=types.SimpleNamespace(getScriptService=lambda: None)),
+    )
+
+    assert imaris_service._find_script_id(conn) == 42
+    assert imaris_service._find_script_id(conn) == 42
+    assert service.calls == 1
+
+    imaris_service._invalidate_script_id_cache()
+    assert imaris_service._find_script_id(conn) == 42
+    assert service.calls == 2
+
+
 def test_wait_for_process_detaches_after_completion(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -237,3 +305,131 @@ def test_wait_for_process_detaches_after_completion(
     assert state == "FINISHED"
     assert outputs == {"Export_Path": "/tmp/export.ims"}
     assert proc.closed is True
+
+
+def test_wait_for_process_backs_off_between_polls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.poll_calls = 0
+
+        def poll(self):
+            self.poll_calls += 1
+            return "FINISHED" if self.poll_calls == 6 else None
+
+        def getResults(self, *_args):
+            return {}
+
+        def close(self, *_args):
+            return None
+
+    sleeps = []
+    monkeypatch.setattr(imaris_service, "EXPORT_POLL_INTERVAL", 1.0)
+    monkeypatch.setattr(imaris_service, "EXPORT_POLL_MAX_INTERVAL", 3.0)
+    monkeypatch.setattr(imaris_service.time, "sleep", sleeps.append)
+
+    state, _outputs = imaris_service._wait_for_process(DummyProcess(), timeout=60)
+
+    assert state == "FINISHED"
+    assert sleeps == [1.0, 1.5, 2.25, 3.0, 3.0]
+
+
+def test_process_job_file_round_trip(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+    monkeypatch.setattr(imaris_service, "PROCESS_JOB_DIR", str(tmp_path))
+    payload = {
+        "job_id": "proc-1",
+        "state": "FINISHED",
+        "outputs": {"Message": "Exported é"},
+        "error": None,
+        "created": 1.5,
+    }
+
+    imaris_service._write_process_job_file("proc-1", payload)
+
+    assert imaris_service._read_process_job_file("proc-1") == payload
+    assert not (tmp_path / "proc-1.json.tmp").exists()
+
+
+def test_iter_script_methods_orders_preferred_then_discovered(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+
+    class DummyService:
+        def runScript(self):
+            return None
+
+        def runScriptAsync(self):
+            return None
+
+        def executeScriptLater(self):
+            return None
+
+        def begin_runScript(self):
+            return None
+
+        def canRunScript(self):
+            return None
+
+        def getScripts(self):
+            return None
+
+    names = [name for name, _meth in imaris_service._iter_script_methods(DummyService())]
+
+    assert names == ["runScriptAsync", "runScript", "executeScriptLater"]
+
+
+def test_read_process_job_file_missing_returns_none(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+    monkeypatch.setattr(imaris_service, "PROCESS_JOB_DIR", str(tmp_path))
+
+    assert imaris_service._read_process_job_file("proc-missing") is None
+
+
+def test_unwrap_rtype_handles_plain_and_wrapped_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+
+    assert imaris_service._unwrap_rtype("name") == "name"
+    assert imaris_service._unwrap_rtype(None) is None
+    assert imaris_service._unwrap_rtype(types.SimpleNamespace(val=5)) == 5
+    assert imaris_service._unwrap_rtype([1]) == [1]
+
+
+def test_normalize_job_state_unwraps_and_uppercases(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+
+    class NamedState:
+        name = "finished"
+
+    assert imaris_service._normalize_job_state(" running ") == "RUNNING"
+    assert imaris_service._normalize_job_state(0) == "0"
+    assert imaris_service._normalize_job_state("  ") is None
+    assert imaris_service._normalize_job_state(types.SimpleNamespace(val="error")) == "ERROR"
+    assert imaris_service._normalize_job_state(NamedState()) == "FINISHED"
+
+
+def test_sanitize_filename_strips_control_chars_and_paths(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_omero_stub()
+    imaris_service = _import_imaris_service(monkeypatch)
+
+    assert imaris_service._sanitize_filename("../dir/ex\x00port\x1f.ims") == "export.ims"
+    assert imaris_service._sanitize_filename(" .\x7f. ") == "export.ims"
+    assert imaris_service._sanitize_filename(None, fallback="x.ims") == "x.ims"